@@ -14,6 +14,9 @@ This script demonstrates the different camera sensors that can be attached to a
     # Usage in headless mode
     ./isaaclab.sh -p scripts/demos/cameras.py --headless --enable_cameras
 
+    # Usage in headless mode, saving the images to disk
+    ./isaaclab.sh -p scripts/demos/cameras.py --headless --enable_cameras --save_images
+
 """
 
 """Launch Isaac Sim Simulator first."""
@@ -26,10 +29,20 @@ from isaaclab.app import AppLauncher
 parser = argparse.ArgumentParser(description="This script demonstrates the different camera sensor implementations.")
 parser.add_argument("--num_envs", type=int, default=4, help="Number of environments to spawn.")
 parser.add_argument("--disable_fabric", action="store_true", help="Disable Fabric API and use USD instead.")
+parser.add_argument("--verbose", action="store_true", default=False, help="Print the sensor summaries on each update.")
+parser.add_argument(
+    "--save_images",
+    action=argparse.BooleanOptionalAction,
+    default=None,
+    help="Save the camera images to disk. Defaults to saving them only when not running headless.",
+)
 # append AppLauncher cli args
 AppLauncher.add_app_launcher_args(parser)
 # parse the arguments
 args_cli = parser.parse_args()
+# saving the images dominates the runtime, so skip it by default in headless runs (e.g. for benchmarking)
+if args_cli.save_images is None:
+    args_cli.save_images = not args_cli.headless
 
 # launch omniverse app
 app_launcher = AppLauncher(args_cli)
@@ -37,10 +50,18 @@ simulation_app = app_launcher.app
 
 """Rest everything follows."""
 
-import matplotlib.pyplot as plt
+import collections
+import matplotlib
+
+# the figures are only saved to disk, so use the non-interactive backend to avoid GUI event processing
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # isort: skip
 import numpy as np
 import os
 import torch
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image
 
 import isaaclab.sim as sim_utils
 from isaaclab.assets import ArticulationCfg, AssetBaseCfg
@@ -115,8 +136,55 @@ class SensorsSceneCfg(InteractiveSceneCfg):
     )
 
 
+_TURBO_LUT: dict[torch.device, torch.Tensor] = {}
+"""Lookup table of the turbo colormap as uint8 RGB values, keyed by the device it lives on."""
+
+
+def colorize_depth(depth: torch.Tensor) -> torch.Tensor:
+    """Map a depth image to RGB with the turbo colormap.
+
+    The mapping is done on the device of the image with a 256-entry lookup table, so only the colored image
+    needs to be moved to the host. The depth is normalized to the range of its finite values. Non-finite
+    values (for instance, rays that did not hit anything) are colored black.
+
+    Args:
+        depth: The depth image. Shape is (H, W) or (H, W, 1).
+
+    Returns:
+        The colored image. Shape is (H, W, 3) and dtype is uint8.
+    """
+    if depth.device not in _TURBO_LUT:
+        lut = matplotlib.colormaps["turbo"](np.linspace(0.0, 1.0, 256))[:, :3] * 255
+        _TURBO_LUT[depth.device] = torch.tensor(lut, dtype=torch.uint8, device=depth.device)
+    lut = _TURBO_LUT[depth.device]
+    # normalize the depth to the lookup table indices
+    depth = depth.reshape(depth.shape[0], depth.shape[1])
+    valid = torch.isfinite(depth)
+    if not torch.any(valid):
+        return torch.zeros(*depth.shape, 3, dtype=torch.uint8, device=depth.device)
+    lower, upper = torch.aminmax(depth[valid])
+    ids = (depth - lower) / (upper - lower).clamp_min(1e-6) * (lut.shape[0] - 1)
+    ids = ids.nan_to_num_(0.0).clamp_(0, lut.shape[0] - 1).long()
+    # look up the colors and black out the invalid pixels
+    rgb = lut[ids]
+    rgb[~valid] = 0
+    return rgb
+
+
+_FIGURE_CACHE: dict[tuple, tuple[plt.Figure, list]] = {}
+"""Cache of figures and image artists created by :func:`save_images_grid`, keyed by the grid layout."""
+
+_SAVE_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+"""Executor that encodes and writes the rendered figures to disk in the background."""
+
+_PENDING_SAVES: collections.deque = collections.deque()
+"""Futures of the figures that are still being written to disk."""
+_MAX_PENDING_SAVES = 4
+"""Maximum number of figures that may be waiting to be written before saving blocks."""
+
+
 def save_images_grid(
-    images: list[torch.Tensor],
+    images: list[torch.Tensor] | torch.Tensor,
     cmap: str | None = None,
     nrow: int = 1,
     subtitles: list[str] | None = None,
@@ -125,8 +193,12 @@ def save_images_grid(
 ):
     """Save images in a grid with optional subtitles and title.
 
+    The figure for a given grid layout is created on the first call and re-used on subsequent calls.
+    Only the pixel data of the images is updated, which avoids re-creating the axes on every save.
+
     Args:
-        images: A list of images to be plotted. Shape of each image should be (H, W, C).
+        images: A list of images or a batched tensor of images to be plotted. Shape of each image
+            should be (H, W, C).
         cmap: Colormap to be used for plotting. Defaults to None, in which case the default colormap is used.
         nrows: Number of rows in the grid. Defaults to 1.
         subtitles: A list of subtitles for each image. Defaults to None, in which case no subtitles are shown.
@@ -136,32 +208,71 @@ def save_images_grid(
     # show images in a grid
     n_images = len(images)
     ncol = int(np.ceil(n_images / nrow))
+    # move the images to the host: a batched tensor is copied in a single transfer
+    if isinstance(images, torch.Tensor):
+        images = list(images.detach().cpu().numpy())
+    else:
+        images = [img.detach().cpu().numpy() for img in images]
+
+    # resolve the figure for this grid layout
+    key = (nrow, ncol, cmap, title, tuple(subtitles or ()), tuple(img.shape for img in images))
+    if key not in _FIGURE_CACHE:
+        fig, axes = plt.subplots(nrow, ncol, figsize=(ncol * 2, nrow * 2))
+        axes = np.atleast_1d(axes).flatten()
+        # plot images
+        artists = []
+        for idx, (img, ax) in enumerate(zip(images, axes)):
+            artists.append(ax.imshow(img, cmap=cmap))
+            ax.axis("off")
+            if subtitles:
+                ax.set_title(subtitles[idx])
+        # remove extra axes if any
+        for ax in axes[n_images:]:
+            fig.delaxes(ax)
+        # set title
+        if title:
+            fig.suptitle(title)
+        # adjust layout to fit the title
+        fig.tight_layout()
+        _FIGURE_CACHE[key] = (fig, artists)
+    else:
+        fig, artists = _FIGURE_CACHE[key]
+        # update the pixel data of the existing images
+        for img, artist in zip(images, artists):
+            artist.set_data(img)
+            # single-channel images are color-mapped, so the color limits need to follow the new data
+            if img.ndim == 2:
+                artist.autoscale()
 
-    fig, axes = plt.subplots(nrow, ncol, figsize=(ncol * 2, nrow * 2))
-    axes = axes.flatten()
-
-    # plot images
-    for idx, (img, ax) in enumerate(zip(images, axes)):
-        img = img.detach().cpu().numpy()
-        ax.imshow(img, cmap=cmap)
-        ax.axis("off")
-        if subtitles:
-            ax.set_title(subtitles[idx])
-    # remove extra axes if any
-    for ax in axes[n_images:]:
-        fig.delaxes(ax)
-    # set title
-    if title:
-        plt.suptitle(title)
-
-    # adjust layout to fit the title
-    plt.tight_layout()
     # save the figure
     if filename:
         os.makedirs(os.path.dirname(filename), exist_ok=True)
-        plt.savefig(filename)
-    # close the figure
-    plt.close()
+        # render the figure here since matplotlib is not thread-safe, and only encode and write it in the background
+        fig.canvas.draw()
+        pixels = np.array(fig.canvas.buffer_rgba())[..., :3]
+        # wait for the oldest writes to finish if the disk can not keep up
+        while len(_PENDING_SAVES) >= _MAX_PENDING_SAVES:
+            _PENDING_SAVES.popleft().result()
+        _PENDING_SAVES.append(_SAVE_EXECUTOR.submit(Image.fromarray(pixels).save, filename))
+
+
+def wait_for_saved_images():
+    """Wait until all figures queued by :func:`save_images_grid` are written to disk.
+
+    All pending writes are waited for, even if some of them fail.
+
+    Raises:
+        Exception: The error of the first write that failed, if any.
+    """
+    errors = []
+    while _PENDING_SAVES:
+        try:
+            _PENDING_SAVES.popleft().result()
+        except Exception as e:
+            print(f"[ERROR]: Failed to save image: {e}")
+            errors.append(e)
+    if errors:
+        raise errors[0]
 
 
 def run_simulator(sim: sim_utils.SimulationContext, scene: InteractiveScene):
@@ -170,10 +281,13 @@ def run_simulator(sim: sim_utils.SimulationContext, scene: InteractiveScene):
     sim_dt = sim.get_physics_dt()
     sim_time = 0.0
     count = 0
+    # the cameras only produce new data at their update period, so there is no need to inspect them every step
+    render_stride = max(1, round(scene["camera"].cfg.update_period / sim_dt))
 
     # Create output directory to save images
     output_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "output")
-    os.makedirs(output_dir, exist_ok=True)
+    if args_cli.save_images:
+        os.makedirs(output_dir, exist_ok=True)
 
     # Simulate physics
     while simulation_app.is_running():
@@ -214,63 +328,72 @@ def run_simulator(sim: sim_utils.SimulationContext, scene: InteractiveScene):
         # update buffers
         scene.update(sim_dt)
 
+        # inspect the sensors only when they have been updated
+        if count % render_stride != 0:
+            continue
+
         # print information from the sensors
         print("-------------------------------")
-        print(scene["camera"])
+        if args_cli.verbose:
+            print(scene["camera"])
         print("Received shape of rgb   image: ", scene["camera"].data.output["rgb"].shape)
         print("Received shape of depth image: ", scene["camera"].data.output["distance_to_image_plane"].shape)
         print("-------------------------------")
-        print(scene["tiled_camera"])
+        if args_cli.verbose:
+            print(scene["tiled_camera"])
         print("Received shape of rgb   image: ", scene["tiled_camera"].data.output["rgb"].shape)
         print("Received shape of depth image: ", scene["tiled_camera"].data.output["distance_to_image_plane"].shape)
         print("-------------------------------")
-        print(scene["raycast_camera"])
+        if args_cli.verbose:
+            print(scene["raycast_camera"])
         print("Received shape of depth: ", scene["raycast_camera"].data.output["distance_to_image_plane"].shape)
         print("Received shape of normals: ", scene["raycast_camera"].data.output["normals"].shape)
 
-        # save every 10th image (for visualization purposes only)
+        # save the images (for visualization purposes only)
         # note: saving images will slow down the simulation
-        if count % 10 == 0:
-            # compare generated RGB images across different cameras
-            rgb_images = [scene["camera"].data.output["rgb"][0, ..., :3], scene["tiled_camera"].data.output["rgb"][0]]
-            save_images_grid(
-                rgb_images,
-                subtitles=["Camera", "TiledCamera"],
-                title="RGB Image: Cam0",
-                filename=os.path.join(output_dir, "rgb", f"{count:04d}.jpg"),
-            )
-
-            # compare generated Depth images across different cameras
-            depth_images = [
-                scene["camera"].data.output["distance_to_image_plane"][0],
-                scene["tiled_camera"].data.output["distance_to_image_plane"][0, ..., 0],
-                scene["raycast_camera"].data.output["distance_to_image_plane"][0],
-            ]
-            save_images_grid(
-                depth_images,
-                cmap="turbo",
-                subtitles=["Camera", "TiledCamera", "RaycasterCamera"],
-                title="Depth Image: Cam0",
-                filename=os.path.join(output_dir, "distance_to_camera", f"{count:04d}.jpg"),
-            )
-
-            # save all tiled RGB images
-            tiled_images = scene["tiled_camera"].data.output["rgb"]
-            save_images_grid(
-                tiled_images,
-                subtitles=[f"Cam{i}" for i in range(tiled_images.shape[0])],
-                title="Tiled RGB Image",
-                filename=os.path.join(output_dir, "tiled_rgb", f"{count:04d}.jpg"),
-            )
-
-            # save all camera RGB images
-            cam_images = scene["camera"].data.output["rgb"][..., :3]
-            save_images_grid(
-                cam_images,
-                subtitles=[f"Cam{i}" for i in range(cam_images.shape[0])],
-                title="Camera RGB Image",
-                filename=os.path.join(output_dir, "cam_rgb", f"{count:04d}.jpg"),
-            )
+        if not args_cli.save_images:
+            continue
+        # drop the alpha channel of the camera images once, so that all grids share a contiguous RGB copy
+        cam_images = scene["camera"].data.output["rgb"][..., :3].contiguous()
+        tiled_images = scene["tiled_camera"].data.output["rgb"]
+        # compare generated RGB images across different cameras
+        rgb_images = [cam_images[0], tiled_images[0]]
+        save_images_grid(
+            rgb_images,
+            subtitles=["Camera", "TiledCamera"],
+            title="RGB Image: Cam0",
+            filename=os.path.join(output_dir, "rgb", f"{count:04d}.jpg"),
+        )
+
+        # compare generated Depth images across different cameras
+        # note: the depth is colored on the device so that only the RGB images are copied to the host
+        depth_images = [
+            colorize_depth(scene["camera"].data.output["distance_to_image_plane"][0]),
+            colorize_depth(scene["tiled_camera"].data.output["distance_to_image_plane"][0, ..., 0]),
+            colorize_depth(scene["raycast_camera"].data.output["distance_to_image_plane"][0]),
+        ]
+        save_images_grid(
+            depth_images,
+            subtitles=["Camera", "TiledCamera", "RaycasterCamera"],
+            title="Depth Image: Cam0",
+            filename=os.path.join(output_dir, "distance_to_camera", f"{count:04d}.jpg"),
+        )
+
+        # save all tiled RGB images
+        save_images_grid(
+            tiled_images,
+            subtitles=[f"Cam{i}" for i in range(tiled_images.shape[0])],
+            title="Tiled RGB Image",
+            filename=os.path.join(output_dir, "tiled_rgb", f"{count:04d}.jpg"),
+        )
+
+        # save all camera RGB images
+        save_images_grid(
+            cam_images,
+            subtitles=[f"Cam{i}" for i in range(cam_images.shape[0])],
+            title="Camera RGB Image",
+            filename=os.path.join(output_dir, "cam_rgb", f"{count:04d}.jpg"),
+        )
 
 
 def main():
@@ -288,7 +411,12 @@ def main():
     # Now we are ready!
     print("[INFO]: Setup complete...")
     # Run the simulator
-    run_simulator(sim, scene)
+    try:
+        run_simulator(sim, scene)
+    finally:
+        # make sure the queued images are written before the app is closed
+        wait_for_saved_images()
+        _SAVE_EXECUTOR.shutdown()
 
 
 if __name__ == "__main__":
@@ -4,6 +4,7 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 import argparse
+import json
 import os
 import re
 import subprocess
@@ -25,15 +26,15 @@ Usage:
     # For options, supply -h arg
 """
 
+RAY_ADDRESS_PATTERN = re.compile(r"RAY_ADDRESS='([^']+)'")
+"""Pattern for the Ray address that accepts job requests, as printed in the head container logs."""
+
 
 def get_namespace() -> str:
     """Get the current Kubernetes namespace from the context, fallback to default if not set"""
     try:
-        namespace = (
-            subprocess.check_output(["kubectl", "config", "view", "--minify", "--output", "jsonpath={..namespace}"])
-            .decode()
-            .strip()
-        )
+        cmd = ["kubectl", "config", "view", "--minify", "--output", "jsonpath={..namespace}"]
+        namespace = subprocess.run(cmd, stdout=subprocess.PIPE, text=True, check=True).stdout.strip()
         if not namespace:
             namespace = "default"
     except subprocess.CalledProcessError:
@@ -42,15 +43,25 @@ def get_namespace() -> str:
 
 
 def get_pods(namespace: str = "default") -> list[tuple]:
-    """Get a list of all of the pods in the namespace"""
-    cmd = ["kubectl", "get", "pods", "-n", namespace, "--no-headers"]
-    output = subprocess.check_output(cmd).decode()
+    """Get a list of all of the pods in the namespace, with their phase and whether they are ready"""
+    cmd = [
+        "kubectl",
+        "get",
+        "pods",
+        "-n",
+        namespace,
+        "-o",
+        "jsonpath={range .items[*]}{.metadata.name} {.status.phase} "
+        '{.status.conditions[?(@.type=="Ready")].status}{"\\n"}{end}',
+    ]
+    output = subprocess.run(cmd, stdout=subprocess.PIPE, text=True, check=True).stdout
     pods = []
-    for line in output.strip().split("\n"):
-        fields = line.split()
-        pod_name = fields[0]
-        status = fields[2]
-        pods.append((pod_name, status))
+    for line in output.splitlines():
+        if not line:
+            continue
+        # the ready status is empty for pods that have not been scheduled yet
+        pod_name, phase, ready = (line.split(" ") + ["", ""])[:3]
+        pods.append((pod_name, phase, ready))
     return pods
 
 
@@ -60,12 +71,13 @@ def get_clusters(pods: list, cluster_name_prefix: str) -> set:
     Excludes MLflow deployments.
     """
     clusters = set()
-    for pod_name, _ in pods:
+    cluster_name_pattern = re.compile(r"(" + re.escape(cluster_name_prefix) + r"[-\w]+)")
+    for pod_name, *_ in pods:
         # Skip MLflow pods
         if "-mlflow" in pod_name:
             continue
 
-        match = re.match(r"(" + re.escape(cluster_name_prefix) + r"[-\w]+)", pod_name)
+        match = cluster_name_pattern.match(pod_name)
         if match:
             # Get base name without head/worker suffix (skip workers)
             if "head" in pod_name:
@@ -74,6 +86,32 @@ def get_clusters(pods: list, cluster_name_prefix: str) -> set:
     return sorted(clusters)
 
 
+def group_pods_by_cluster(pods: list, clusters: set) -> dict[str, list[tuple]]:
+    """
+    Group the pods by the cluster they belong to, in a single pass over the pods.
+
+    Args:
+        pods (list): A list of tuples where each tuple contains the pod name, its phase and its ready status.
+        clusters (set): A set of cluster names to group the pods by.
+
+    Returns:
+        dict: A mapping from each cluster name to the list of its pods. Pods that do not belong to any of
+        the clusters are skipped.
+    """
+    pods_by_cluster = {cluster: [] for cluster in clusters}
+    if not clusters:
+        return pods_by_cluster
+    # longer names first so that a cluster name which is a prefix of another does not take its pods
+    cluster_pattern = re.compile(
+        "(" + "|".join(re.escape(cluster) for cluster in sorted(clusters, key=len, reverse=True)) + ")-"
+    )
+    for pod in pods:
+        match = cluster_pattern.match(pod[0])
+        if match:
+            pods_by_cluster[match.group(1)].append(pod)
+    return pods_by_cluster
+
+
 def get_mlflow_info(namespace: str = None, cluster_prefix: str = "isaacray") -> str:
     """
     Get MLflow service information if it exists in the namespace with the given prefix.
@@ -95,7 +133,7 @@ def get_mlflow_info(namespace: str = None, cluster_prefix: str = "isaacray") ->
 
     cmd = ["kubectl", "get", "svc", mlflow_name, "-n", namespace, "--no-headers"]
     try:
-        output = subprocess.check_output(cmd).decode()
+        output = subprocess.run(cmd, stdout=subprocess.PIPE, text=True, check=True).stdout
         fields = output.strip().split()
 
         # Get cluster IP
@@ -110,26 +148,78 @@ def get_mlflow_info(namespace: str = None, cluster_prefix: str = "isaacray") ->
 
 def check_clusters_running(pods: list, clusters: set) -> bool:
     """
-    Check that all of the pods in all provided clusters are running.
+    Check that all of the pods in all provided clusters are ready.
 
     Args:
-        pods (list): A list of tuples where each tuple contains the pod name and its status.
+        pods (list): A list of tuples where each tuple contains the pod name, its phase and its ready status.
         clusters (set): A set of cluster names to check.
 
     Returns:
-        bool: True if all pods in any of the clusters are running, False otherwise.
+        bool: True if all pods in any of the clusters are ready, False otherwise.
     """
     clusters_running = False
-    for cluster in clusters:
-        cluster_pods = [p for p in pods if p[0].startswith(cluster)]
+    for cluster_pods in group_pods_by_cluster(pods, clusters).values():
         total_pods = len(cluster_pods)
-        running_pods = len([p for p in cluster_pods if p[1] == "Running"])
+        running_pods = len([p for p in cluster_pods if p[2] == "True"])
         if running_pods == total_pods and running_pods > 0:
             clusters_running = True
             break
     return clusters_running
 
 
+def wait_for_clusters(clusters: set, namespace: str = "default", timeout: str = "60s") -> bool:
+    """
+    Block until all of the pods in any of the provided clusters are ready, using ``kubectl wait``.
+
+    This follows :func:`check_clusters_running`: one ``kubectl wait`` is run per cluster and the wait ends as
+    soon as one of them succeeds. KubeRay labels every pod of a cluster with ``ray.io/cluster=<cluster name>``,
+    which is used to select the pods. The error output of every failed wait is printed.
+
+    Args:
+        clusters (set): A set of cluster names to wait for.
+        namespace (str, optional): The Kubernetes namespace. Defaults to "default".
+        timeout (str, optional): The maximum time to wait for, in kubectl duration format. Defaults to "60s".
+
+    Returns:
+        bool: True if all pods of any of the clusters became ready within the timeout, False otherwise.
+    """
+    waits = {
+        cluster: subprocess.Popen(
+            [
+                "kubectl",
+                "wait",
+                "--for=condition=Ready",
+                "pod",
+                "-l",
+                f"ray.io/cluster={cluster}",
+                "-n",
+                namespace,
+                f"--timeout={timeout}",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        for cluster in clusters
+    }
+    try:
+        while waits:
+            for cluster, wait in list(waits.items()):
+                if wait.poll() is None:
+                    continue
+                del waits[cluster]
+                if wait.returncode == 0:
+                    return True
+                print(f"Could not wait for the pods of cluster {cluster}: {wait.stderr.read().strip()}")
+            time.sleep(0.5)
+        return False
+    finally:
+        # stop waiting on the remaining clusters
+        for wait in waits.values():
+            wait.terminate()
+            wait.wait()
+
+
 def get_ray_address(head_pod: str, namespace: str = "default", ray_head_name: str = "head") -> str:
     """
     Given a cluster head pod, check its logs, which should include the ray address which can accept job requests.
@@ -147,32 +237,65 @@ def get_ray_address(head_pod: str, namespace: str = "default", ray_head_name: st
     """
     cmd = ["kubectl", "logs", head_pod, "-c", ray_head_name, "-n", namespace]
     try:
-        output = subprocess.check_output(cmd).decode()
+        output = subprocess.run(cmd, stdout=subprocess.PIPE, text=True, check=True).stdout
     except subprocess.CalledProcessError as e:
         raise ValueError(
             f"Could not enter head container with cmd {cmd}: {e}Perhaps try a different namespace or ray head name."
         )
-    match = re.search(r"RAY_ADDRESS='([^']+)'", output)
+    match = RAY_ADDRESS_PATTERN.search(output)
     if match:
         return match.group(1)
     else:
         return None
 
 
-def process_cluster(cluster_info: dict, ray_head_name: str = "head") -> str:
+def load_address_cache(cache_file: str) -> dict[str, str]:
+    """
+    Load the cached Ray addresses, keyed by the name of the head pod they were read from.
+
+    Args:
+        cache_file (str): The path to the cache file.
+
+    Returns:
+        dict: The cached addresses, or an empty dictionary if the cache does not exist or cannot be read.
+    """
+    try:
+        with open(cache_file) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_address_cache(cache_file: str, address_cache: dict[str, str]):
+    """
+    Atomically write the cached Ray addresses, so that a concurrent reader never sees a partial file.
+
+    Args:
+        cache_file (str): The path to the cache file.
+        address_cache (dict): The addresses to cache, keyed by the name of the head pod.
+    """
+    tmp_file = f"{cache_file}.tmp"
+    with open(tmp_file, "w") as f:
+        json.dump(address_cache, f)
+    os.replace(tmp_file, cache_file)
+
+
+def process_cluster(cluster_info: dict, ray_head_name: str = "head", address_cache: dict | None = None) -> str:
     """
     For each cluster, check that it is running, and get the Ray head address that will accept jobs.
 
     Args:
         cluster_info (dict): A dictionary containing cluster information with keys 'cluster', 'pods', and 'namespace'.
         ray_head_name (str, optional): The name of the ray head container. Defaults to "head".
+        address_cache (dict, optional): Ray addresses keyed by head pod name. The head container logs are only
+            read when the head pod is not in the cache, and the found address is added to it. Defaults to None.
 
     Returns:
         str: A string containing the cluster name and its Ray head address, or an error message if the head pod or Ray address is not found.
     """
     cluster, pods, namespace = cluster_info
     head_pod = None
-    for pod_name, status in pods:
+    for pod_name, *_ in pods:
         if pod_name.startswith(cluster + "-head"):
             head_pod = pod_name
             break
@@ -180,9 +303,15 @@ def process_cluster(cluster_info: dict, ray_head_name: str = "head") -> str:
         return f"Error: Could not find head pod for cluster {cluster}\n"
 
     # Get RAY_ADDRESS and status
-    ray_address = get_ray_address(head_pod, namespace=namespace, ray_head_name=ray_head_name)
+    # note: the head pod name changes whenever the head is re-created, so a cached address for it is still valid
+    if address_cache is not None and head_pod in address_cache:
+        ray_address = address_cache[head_pod]
+    else:
+        ray_address = get_ray_address(head_pod, namespace=namespace, ray_head_name=ray_head_name)
     if not ray_address:
         return f"Error: Could not find RAY_ADDRESS for cluster {cluster}\n"
+    if address_cache is not None:
+        address_cache[head_pod] = ray_address
 
     # Return only cluster and ray address
     return f"name: {cluster} address: {ray_address}\n"
@@ -194,6 +323,11 @@ def main():
     parser.add_argument("--prefix", default="isaacray", help="The prefix for the cluster names.")
     parser.add_argument("--output", default="~/.cluster_config", help="The file to save cluster specifications.")
     parser.add_argument("--ray_head_name", default="head", help="The metadata name for the ray head container")
+    parser.add_argument(
+        "--wait_timeout",
+        default="60s",
+        help="How long to wait for the cluster pods to become ready before falling back to polling their status.",
+    )
     parser.add_argument(
         "--namespace", help="Kubernetes namespace to use. If not provided, will detect from current context."
     )
@@ -205,6 +339,7 @@ def main():
 
     cluster_name_prefix = args.prefix
     cluster_spec_file = os.path.expanduser(args.output)
+    address_cache_file = f"{cluster_spec_file}.cache.json"
 
     # Get all pods
     pods = get_pods(namespace=current_namespace)
@@ -216,36 +351,46 @@ def main():
         return
 
     # Wait for clusters to be running
-    while True:
-        pods = get_pods(namespace=current_namespace)
-        if check_clusters_running(pods, clusters):
-            break
-        print("Waiting for all clusters to spin up...")
-        time.sleep(5)
+    print(f"Waiting up to {args.wait_timeout} for a cluster to spin up...")
+    if not wait_for_clusters(clusters, namespace=current_namespace, timeout=args.wait_timeout):
+        # fall back to polling the pod status if the pods could not be waited on
+        print("Falling back to polling the pod status.")
+        while not check_clusters_running(get_pods(namespace=current_namespace), clusters):
+            print("Waiting for all clusters to spin up...")
+            time.sleep(5)
+    pods = get_pods(namespace=current_namespace)
 
     print("Checking for MLflow:")
-    # Check MLflow status for each cluster
-    for cluster in clusters:
+    # Check MLflow status for each cluster, querying kubectl for all clusters concurrently
+    with ThreadPoolExecutor(max_workers=min(32, len(clusters))) as executor:
+        mlflow_futures = {
+            cluster: executor.submit(get_mlflow_info, current_namespace, cluster) for cluster in clusters
+        }
+    for cluster, future in mlflow_futures.items():
         try:
-            mlflow_address = get_mlflow_info(current_namespace, cluster)
+            mlflow_address = future.result()
             print(f"MLflow address for {cluster}: {mlflow_address}")
         except ValueError as e:
             print(f"ML Flow not located: {e}")
     print()
 
     # Prepare cluster info for parallel processing
-    cluster_infos = []
-    for cluster in clusters:
-        cluster_pods = [p for p in pods if p[0].startswith(cluster)]
-        cluster_infos.append((cluster, cluster_pods, current_namespace))
+    pods_by_cluster = group_pods_by_cluster(pods, clusters)
+    cluster_infos = [(cluster, pods_by_cluster[cluster], current_namespace) for cluster in clusters]
+
+    # Only keep the cached addresses of head pods that still exist
+    pod_names = {pod_name for pod_name, *_ in pods}
+    address_cache = load_address_cache(address_cache_file)
+    address_cache = {pod_name: address for pod_name, address in address_cache.items() if pod_name in pod_names}
 
     # Use ThreadPoolExecutor to process clusters in parallel
     results = []
     results_lock = threading.Lock()
 
-    with ThreadPoolExecutor() as executor:
+    with ThreadPoolExecutor(max_workers=min(32, len(cluster_infos))) as executor:
         future_to_cluster = {
-            executor.submit(process_cluster, info, args.ray_head_name): info[0] for info in cluster_infos
+            executor.submit(process_cluster, info, args.ray_head_name, address_cache): info[0]
+            for info in cluster_infos
         }
         for future in as_completed(future_to_cluster):
             cluster_name = future_to_cluster[future]
@@ -258,16 +403,17 @@ def main():
 
     # Sort results alphabetically by cluster name
     results.sort()
+    # Cache the addresses for the next run
+    save_address_cache(address_cache_file, address_cache)
 
     # Write sorted results to the output file (Ray info only)
+    cluster_spec = "".join(results)
     with open(cluster_spec_file, "w") as f:
-        for result in results:
-            f.write(result)
+        f.write(cluster_spec)
 
     print(f"Cluster spec information saved to {cluster_spec_file}")
     # Display the contents of the config file
-    with open(cluster_spec_file) as f:
-        print(f.read())
+    print(cluster_spec)
 
 
 if __name__ == "__main__":
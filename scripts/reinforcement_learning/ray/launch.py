@@ -4,13 +4,14 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 import argparse
+import functools
 import pathlib
 import subprocess
 import yaml
+from concurrent.futures import ThreadPoolExecutor
 
 import util
-from jinja2 import Environment, FileSystemLoader
-from kubernetes import config
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
 
 """This script helps create one or more KubeRay clusters.
 
@@ -35,53 +36,87 @@ Usage:
     --worker_accelerator nvidia-l4 nvidia-tesla-t4 --gpu_per_worker 1 2 4
 """
 RAY_DIR = pathlib.Path(__file__).parent
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+"""Safe YAML loader, backed by libyaml when PyYAML was built with it."""
 
 
-def apply_manifest(args: argparse.Namespace) -> None:
-    """Provided a Jinja templated ray.io/v1alpha1 file,
-    populate the arguments and create the cluster. Additionally, create
-    kubernetes containers for resources separated by '---' from the rest
-    of the file.
+@functools.lru_cache(maxsize=None)
+def get_template(cluster_host: str) -> Template:
+    """Load the KubeRay template for the cluster host.
+
+    The Jinja2 environment and compiled template are cached, so that creating several clusters
+    only parses the template once. The compiled template is also cached on disk (in the temporary
+    directory of the user), so that later runs of the script do not need to parse it again.
 
     Args:
-        args: Possible arguments concerning cluster parameters.
-    """
-    # Load Kubernetes configuration
-    config.load_kube_config()
+        cluster_host: The name of the folder in the cluster_configs directory that holds the template.
 
+    Returns:
+        The compiled template.
+    """
     # Set up Jinja2 environment for loading templates
-    templates_dir = RAY_DIR / "cluster_configs" / args.cluster_host
+    templates_dir = RAY_DIR / "cluster_configs" / cluster_host
     file_loader = FileSystemLoader(str(templates_dir))
-    jinja_env = Environment(loader=file_loader, keep_trailing_newline=True, autoescape=True)
+    jinja_env = Environment(
+        loader=file_loader,
+        keep_trailing_newline=True,
+        autoescape=True,
+        auto_reload=False,
+        bytecode_cache=FileSystemBytecodeCache(),
+    )
 
-    # Define template filename
-    template_file = "kuberay.yaml.jinja"
+    # Load the template
+    return jinja_env.get_template("kuberay.yaml.jinja")
 
-    # Convert args namespace to a dictionary
-    template_params = vars(args)
 
-    # Load and render the template
-    template = jinja_env.get_template(template_file)
+def render_manifest(template: Template, template_params: dict) -> str:
+    """Provided a Jinja templated ray.io/v1alpha1 file,
+    populate the arguments to create the manifest of the cluster. Additionally, the
+    manifest contains kubernetes containers for resources separated by '---' from the rest
+    of the file.
+
+    Args:
+        template: The compiled template of the cluster host.
+        template_params: Possible arguments concerning cluster parameters.
+
+    Returns:
+        The rendered manifest, with one YAML document per Kubernetes object.
+    """
+    # Render the template
     file_contents = template.render(template_params)
 
-    # Parse all YAML documents in the rendered template
-    all_yamls = []
-    for doc in yaml.safe_load_all(file_contents):
-        all_yamls.append(doc)
+    # Check that all YAML documents in the rendered template are valid
+    # note: the rendered template is applied as is, so it is only parsed here (with libyaml, if available)
+    try:
+        for _ in yaml.load_all(file_contents, Loader=YAML_LOADER):
+            pass
+    except yaml.YAMLError as e:
+        exit(f"The rendered template is not valid YAML: {e}")
+    return file_contents
+
 
-    # Convert back to YAML string, preserving multiple documents
-    cleaned_yaml_string = ""
-    for i, doc in enumerate(all_yamls):
-        if i > 0:
-            cleaned_yaml_string += "\n---\n"
-        cleaned_yaml_string += yaml.dump(doc)
+def apply_manifest(manifest: str) -> str:
+    """Create the Kubernetes objects of a manifest.
 
+    Args:
+        manifest: The manifest to apply. It may contain multiple YAML documents separated by '---'.
+
+    Returns:
+        The combined output and error messages of kubectl.
+
+    Raises:
+        subprocess.CalledProcessError: If kubectl fails. The output of kubectl is stored in its ``output``.
+    """
     # Apply the Kubernetes manifest using kubectl
-    try:
-        print(cleaned_yaml_string)
-        subprocess.run(["kubectl", "apply", "-f", "-"], input=cleaned_yaml_string, text=True, check=True)
-    except subprocess.CalledProcessError as e:
-        exit(f"An error occurred while running `kubectl`: {e}")
+    # note: the output is returned instead of printed, so that concurrent calls do not interleave it
+    result = subprocess.run(
+        ["kubectl", "apply", "-f", "-"],
+        input=manifest.encode(),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        check=True,
+    )
+    return result.stdout.decode()
 
 
 def parse_args() -> argparse.Namespace:
@@ -158,6 +193,15 @@ def parse_args() -> argparse.Namespace:
     )
 
     arg_parser.add_argument("--head_ram_gb", type=int, default=8, help="How many gigs of ram to give the Ray head")
+    arg_parser.add_argument(
+        "--per_cluster_apply",
+        action="store_true",
+        help=(
+            "Apply the manifest of each cluster with a separate kubectl call, so that a failure for one cluster"
+            " does not affect the others. The calls run concurrently. By default, the manifests of all clusters"
+            " are applied at once."
+        ),
+    )
     args = arg_parser.parse_args()
     return util.fill_in_missing_resources(args, cluster_creation_flag=True)
 
@@ -167,13 +211,46 @@ def main():
 
     if "head" in args.name:
         raise ValueError("For compatibility with other scripts, do not include head in the name")
+    # Convert args namespace to a dictionary, of which only the name changes between clusters
+    template = get_template(args.cluster_host)
+    template_params = vars(args).copy()
     if args.num_clusters == 1:
-        apply_manifest(args)
+        manifests = [render_manifest(template, template_params)]
     else:
-        default_name = args.name
+        manifests = []
         for i in range(args.num_clusters):
-            args.name = default_name + "-" + str(i)
-            apply_manifest(args)
+            template_params["name"] = args.name + "-" + str(i)
+            manifests.append(render_manifest(template, template_params))
+
+    # Load Kubernetes configuration
+    # note: the client is imported here since it is slow to import and not needed for parsing the arguments
+    from kubernetes import config
+
+    config.load_kube_config()
+
+    for manifest in manifests:
+        print(manifest)
+
+    if args.per_cluster_apply:
+        manifest_batches = manifests
+    else:
+        # a single kubectl call avoids paying its startup and API discovery once per cluster
+        manifest_batches = ["\n---\n".join(manifests)]
+
+    # the kubectl calls mostly wait on the API server, so overlap them
+    with ThreadPoolExecutor(max_workers=min(8, len(manifest_batches))) as executor:
+        futures = [executor.submit(apply_manifest, manifest) for manifest in manifest_batches]
+
+    # report the outcome of each kubectl call in order
+    errors = []
+    for future in futures:
+        try:
+            print(future.result())
+        except subprocess.CalledProcessError as e:
+            print(e.output.decode())
+            errors.append(e)
+    if errors:
+        exit(f"An error occurred while running `kubectl` ({len(errors)} of {len(futures)} calls failed): {errors[0]}")
 
 
 if __name__ == "__main__":
@@ -44,6 +44,12 @@ parser.add_argument(
     choices=["AMP", "PPO", "IPPO", "MAPPO"],
     help="The RL algorithm used for training the skrl agent.",
 )
+parser.add_argument(
+    "--allow_tf32",
+    action="store_true",
+    default=False,
+    help="Allow TensorFloat-32 for matmuls and convolutions on supported GPUs (faster, but less precise).",
+)
 
 # append AppLauncher cli args
 AppLauncher.add_app_launcher_args(parser)
@@ -65,6 +71,7 @@ simulation_app = app_launcher.app
 import gymnasium as gym
 import os
 import random
+import torch
 from datetime import datetime
 
 import skrl
@@ -100,6 +107,11 @@ from isaaclab.utils.io import dump_pickle, dump_yaml
 import isaaclab_tasks  # noqa: F401
 from isaaclab_tasks.utils.hydra import hydra_task_config
 
+# allow TensorFloat-32 for matmuls and convolutions only when requested, since it changes the training numerics
+if args_cli.allow_tf32:
+    torch.backends.cuda.matmul.allow_tf32 = True
+    torch.backends.cudnn.allow_tf32 = True
+
 # config shortcuts
 algorithm = args_cli.algorithm.lower()
 agent_cfg_entry_point = "skrl_cfg_entry_point" if algorithm in ["ppo"] else f"skrl_{algorithm}_cfg_entry_point"
@@ -148,10 +160,11 @@ def main(env_cfg: ManagerBasedRLEnvCfg | DirectRLEnvCfg | DirectMARLEnvCfg, agen
     log_dir = os.path.join(log_root_path, log_dir)
 
     # dump the configuration into log-directory
-    dump_yaml(os.path.join(log_dir, "params", "env.yaml"), env_cfg)
-    dump_yaml(os.path.join(log_dir, "params", "agent.yaml"), agent_cfg)
-    dump_pickle(os.path.join(log_dir, "params", "env.pkl"), env_cfg)
-    dump_pickle(os.path.join(log_dir, "params", "agent.pkl"), agent_cfg)
+    params_dir = os.path.join(log_dir, "params")
+    dump_yaml(os.path.join(params_dir, "env.yaml"), env_cfg)
+    dump_yaml(os.path.join(params_dir, "agent.yaml"), agent_cfg)
+    dump_pickle(os.path.join(params_dir, "env.pkl"), env_cfg)
+    dump_pickle(os.path.join(params_dir, "agent.pkl"), agent_cfg)
 
     # get checkpoint path (to resume training)
     resume_path = retrieve_file_path(args_cli.checkpoint) if args_cli.checkpoint else None
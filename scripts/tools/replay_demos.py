@@ -45,10 +45,12 @@ simulation_app = app_launcher.app
 
 """Rest everything follows."""
 
+import collections
 import contextlib
 import gymnasium as gym
 import os
 import torch
+from concurrent.futures import ThreadPoolExecutor
 
 from isaaclab.devices import Se3Keyboard
 from isaaclab.utils.datasets import EpisodeData, HDF5DatasetFileHandler
@@ -88,14 +90,15 @@ def compare_states(state_from_dataset, runtime_state, runtime_env_index) -> (boo
             for state_name in runtime_state[asset_type][asset_name].keys():
                 runtime_asset_state = runtime_state[asset_type][asset_name][state_name][runtime_env_index]
                 dataset_asset_state = state_from_dataset[asset_type][asset_name][state_name]
-                if len(dataset_asset_state) != len(runtime_asset_state):
+                if dataset_asset_state.shape != runtime_asset_state.shape:
                     raise ValueError(f"State shape of {state_name} for asset {asset_name} don't match")
-                for i in range(len(dataset_asset_state)):
-                    if abs(dataset_asset_state[i] - runtime_asset_state[i]) > 0.01:
-                        states_matched = False
-                        output_log += f'\tState ["{asset_type}"]["{asset_name}"]["{state_name}"][{i}] don\'t match\r\n'
-                        output_log += f"\t  Dataset:\t{dataset_asset_state[i]}\r\n"
-                        output_log += f"\t  Runtime: \t{runtime_asset_state[i]}\r\n"
+                # compare all elements at once and only report the mismatched ones
+                mismatched_ids = torch.nonzero(torch.abs(dataset_asset_state - runtime_asset_state) > 0.01)
+                for i in mismatched_ids.flatten().tolist():
+                    states_matched = False
+                    output_log += f'\tState ["{asset_type}"]["{asset_name}"]["{state_name}"][{i}] don\'t match\r\n'
+                    output_log += f"\t  Dataset:\t{dataset_asset_state[i]}\r\n"
+                    output_log += f"\t  Runtime: \t{runtime_asset_state[i]}\r\n"
     return states_matched, output_log
 
 
@@ -154,31 +157,44 @@ def main():
     # simulate environment -- run everything in inference mode
     episode_names = list(dataset_file_handler.get_episode_names())
     replayed_episode_count = 0
+
+    # load the upcoming episodes on a background thread so that reading the file overlaps with the simulation
+    # note: a single worker is used since the file handle must not be accessed concurrently
+    episode_loader = ThreadPoolExecutor(max_workers=1)
+    pending_episodes = collections.deque()
+
+    def prefetch_episodes():
+        """Queue the loading of episodes until enough are in flight to refill all environments."""
+        while episode_indices_to_replay and len(pending_episodes) < num_envs + 1:
+            episode_index = episode_indices_to_replay.pop(0)
+            if episode_index < episode_count:
+                future = episode_loader.submit(
+                    dataset_file_handler.load_episode, episode_names[episode_index], env.device
+                )
+                pending_episodes.append((episode_index, future))
+
+    prefetch_episodes()
     with contextlib.suppress(KeyboardInterrupt) and torch.inference_mode():
         while simulation_app.is_running() and not simulation_app.is_exiting():
             env_episode_data_map = {index: EpisodeData() for index in range(num_envs)}
             first_loop = True
             has_next_action = True
+            # allocate the action buffer once on the simulation device
+            actions = torch.zeros(env.action_space.shape, device=env.device)
             while has_next_action:
-                # initialize actions with zeros so those without next action will not move
-                actions = torch.zeros(env.action_space.shape)
+                # reset actions to zeros so those without next action will not move
+                actions.zero_()
                 has_next_action = False
                 for env_id in range(num_envs):
                     env_next_action = env_episode_data_map[env_id].get_next_action()
                     if env_next_action is None:
-                        next_episode_index = None
-                        while episode_indices_to_replay:
-                            next_episode_index = episode_indices_to_replay.pop(0)
-                            if next_episode_index < episode_count:
-                                break
-                            next_episode_index = None
-
-                        if next_episode_index is not None:
+                        if pending_episodes:
+                            next_episode_index, episode_future = pending_episodes.popleft()
                             replayed_episode_count += 1
                             print(f"{replayed_episode_count :4}: Loading #{next_episode_index} episode to env_{env_id}")
-                            episode_data = dataset_file_handler.load_episode(
-                                episode_names[next_episode_index], env.device
-                            )
+                            episode_data = episode_future.result()
+                            # queue the next episode while this one is replayed
+                            prefetch_episodes()
                             env_episode_data_map[env_id] = episode_data
                             # Set initial state for the new episode
                             initial_state = episode_data.get_initial_state()
@@ -214,6 +230,7 @@ def main():
                             print("\t- mismatched.")
                             print(comparison_log)
             break
+    episode_loader.shutdown(cancel_futures=True)
     # Close environment after replay in complete
     plural_trailing_s = "s" if replayed_episode_count > 1 else ""
     print(f"Finished replaying {replayed_episode_count} episode{plural_trailing_s}.")
@@ -41,6 +41,7 @@ class OperationalSpaceController:
 
         Raises:
             ValueError: When invalid control command is provided.
+            ValueError: When invalid impedance mode is provided.
         """
         # store inputs
         self.cfg = cfg
@@ -60,17 +61,33 @@ class OperationalSpaceController:
                 raise ValueError(f"Invalid control command: {command_type}.")
         self.target_dim = sum(self.target_list)
 
+        # resolve the action dimension based on the impedance mode
+        # note: this is done once here since the dimension is checked against on every call to `set_command`
+        if self.cfg.impedance_mode == "fixed":
+            # task-space targets
+            self._action_dim = self.target_dim
+        elif self.cfg.impedance_mode == "variable_kp":
+            # task-space targets + stiffness
+            self._action_dim = self.target_dim + 6
+        elif self.cfg.impedance_mode == "variable":
+            # task-space targets + stiffness + damping
+            self._action_dim = self.target_dim + 6 + 6
+        else:
+            raise ValueError(f"Invalid impedance mode: {self.cfg.impedance_mode}.")
+
         # create buffers
         # -- selection matrices, which might be defined in the task reference frame different from the root frame
+        # note: the per-axis values are broadcast over the environments with `expand`, which does not allocate
+        #   any memory. The batched buffers are only allocated once by `diag_embed`.
         self._selection_matrix_motion_task = torch.diag_embed(
-            torch.tensor(self.cfg.motion_control_axes_task, dtype=torch.float, device=self._device)
-            .unsqueeze(0)
-            .repeat(self.num_envs, 1)
+            torch.tensor(self.cfg.motion_control_axes_task, dtype=torch.float, device=self._device).expand(
+                self.num_envs, 6
+            )
         )
         self._selection_matrix_force_task = torch.diag_embed(
-            torch.tensor(self.cfg.contact_wrench_control_axes_task, dtype=torch.float, device=self._device)
-            .unsqueeze(0)
-            .repeat(self.num_envs, 1)
+            torch.tensor(self.cfg.contact_wrench_control_axes_task, dtype=torch.float, device=self._device).expand(
+                self.num_envs, 6
+            )
         )
         # -- selection matrices in root frame
         self._selection_matrix_motion_b = torch.zeros_like(self._selection_matrix_motion_task)
@@ -88,16 +105,20 @@ class OperationalSpaceController:
         self._mass_matrix_inv = None
         # -- motion control gains
         self._motion_p_gains_task = torch.diag_embed(
-            torch.ones(self.num_envs, 6, device=self._device)
-            * torch.tensor(self.cfg.motion_stiffness_task, dtype=torch.float, device=self._device)
+            torch.tensor(self.cfg.motion_stiffness_task, dtype=torch.float, device=self._device).expand(
+                self.num_envs, 6
+            )
         )
         # -- -- zero out the axes that are not motion controlled, as keeping them non-zero will cause other axes
         # -- -- to act due to coupling
         self._motion_p_gains_task[:] = self._selection_matrix_motion_task @ self._motion_p_gains_task[:]
+        # -- -- scaling of the damping gains w.r.t. square-root of the stiffness gains: 2 * damping_ratio
+        # -- -- note: this is constant for the "fixed" and "variable_kp" impedance modes, so we compute it once here
+        self._motion_d_gains_scale_task = 2 * torch.tensor(
+            self.cfg.motion_damping_ratio_task, dtype=torch.float, device=self._device
+        ).reshape(1, -1)
         self._motion_d_gains_task = torch.diag_embed(
-            2
-            * torch.diagonal(self._motion_p_gains_task, dim1=-2, dim2=-1).sqrt()
-            * torch.as_tensor(self.cfg.motion_damping_ratio_task, dtype=torch.float, device=self._device).reshape(1, -1)
+            torch.diagonal(self._motion_p_gains_task, dim1=-2, dim2=-1).sqrt() * self._motion_d_gains_scale_task
         )
         # -- -- motion control gains in root frame
         self._motion_p_gains_b = torch.zeros_like(self._motion_p_gains_task)
@@ -105,8 +126,9 @@ class OperationalSpaceController:
         # -- force control gains
         if self.cfg.contact_wrench_stiffness_task is not None:
             self._contact_wrench_p_gains_task = torch.diag_embed(
-                torch.ones(self.num_envs, 6, device=self._device)
-                * torch.tensor(self.cfg.contact_wrench_stiffness_task, dtype=torch.float, device=self._device)
+                torch.tensor(self.cfg.contact_wrench_stiffness_task, dtype=torch.float, device=self._device).expand(
+                    self.num_envs, 6
+                )
             )
             self._contact_wrench_p_gains_task[:] = (
                 self._selection_matrix_force_task @ self._contact_wrench_p_gains_task[:]
@@ -117,19 +139,22 @@ class OperationalSpaceController:
             self._contact_wrench_p_gains_task = None
             self._contact_wrench_p_gains_b = None
         # -- position gain limits
-        self._motion_p_gains_limits = torch.zeros(self.num_envs, 6, 2, device=self._device)
-        self._motion_p_gains_limits[..., 0], self._motion_p_gains_limits[..., 1] = (
-            self.cfg.motion_stiffness_limits_task[0],
-            self.cfg.motion_stiffness_limits_task[1],
+        # note: the limits are the same for all environments and axes. Storing them as scalars avoids
+        #   reading batched bound tensors from memory when clipping the gains at every step.
+        self._motion_p_gains_limits = (
+            float(self.cfg.motion_stiffness_limits_task[0]),
+            float(self.cfg.motion_stiffness_limits_task[1]),
         )
         # -- damping ratio limits
-        self._motion_damping_ratio_limits = torch.zeros_like(self._motion_p_gains_limits)
-        self._motion_damping_ratio_limits[..., 0], self._motion_damping_ratio_limits[..., 1] = (
-            self.cfg.motion_damping_ratio_limits_task[0],
-            self.cfg.motion_damping_ratio_limits_task[1],
+        self._motion_damping_ratio_limits = (
+            float(self.cfg.motion_damping_ratio_limits_task[0]),
+            float(self.cfg.motion_damping_ratio_limits_task[1]),
         )
         # -- end-effector contact wrench
         self._ee_contact_wrench_b = torch.zeros(self.num_envs, 6, device=self._device)
+        # -- default task frame pose (identity), used when the task frame pose is not provided
+        self._default_task_frame_pose_b = torch.zeros(self.num_envs, 7, device=self._device)
+        self._default_task_frame_pose_b[:, 3] = 1.0
 
         # -- buffers for null-space control gains
         self._nullspace_p_gain = torch.tensor(self.cfg.nullspace_stiffness, dtype=torch.float, device=self._device)
@@ -146,18 +171,7 @@ class OperationalSpaceController:
     @property
     def action_dim(self) -> int:
         """Dimension of the action space of controller."""
-        # impedance mode
-        if self.cfg.impedance_mode == "fixed":
-            # task-space targets
-            return self.target_dim
-        elif self.cfg.impedance_mode == "variable_kp":
-            # task-space targets + stiffness
-            return self.target_dim + 6
-        elif self.cfg.impedance_mode == "variable":
-            # task-space targets + stiffness + damping
-            return self.target_dim + 6 + 6
-        else:
-            raise ValueError(f"Invalid impedance mode: {self.cfg.impedance_mode}.")
+        return self._action_dim
 
     """
     Operations.
@@ -208,9 +222,9 @@ class OperationalSpaceController:
             ValueError: When an invalid control command is provided.
         """
         # Check the input dimensions
-        if command.shape != (self.num_envs, self.action_dim):
+        if command.shape != (self.num_envs, self._action_dim):
             raise ValueError(
-                f"Invalid command shape '{command.shape}'. Expected: '{(self.num_envs, self.action_dim)}'."
+                f"Invalid command shape '{command.shape}'. Expected: '{(self.num_envs, self._action_dim)}'."
             )
 
         # Resolve the impedance parameters
@@ -222,28 +236,27 @@ class OperationalSpaceController:
             task_space_command, stiffness = torch.split(command, [self.target_dim, 6], dim=-1)
             # format command
             stiffness = stiffness.clip_(
-                min=self._motion_p_gains_limits[..., 0], max=self._motion_p_gains_limits[..., 1]
+                min=self._motion_p_gains_limits[0], max=self._motion_p_gains_limits[1]
             )
             # task space targets + stiffness
             self._task_space_target_task[:] = task_space_command.squeeze(dim=-1)
             self._motion_p_gains_task[:] = torch.diag_embed(stiffness)
             self._motion_p_gains_task[:] = self._selection_matrix_motion_task @ self._motion_p_gains_task[:]
-            self._motion_d_gains_task = torch.diag_embed(
-                2
-                * torch.diagonal(self._motion_p_gains_task, dim1=-2, dim2=-1).sqrt()
-                * torch.as_tensor(self.cfg.motion_damping_ratio_task, dtype=torch.float, device=self._device).reshape(
-                    1, -1
-                )
+            # note: the damping gains are diagonal, so only the diagonal is updated in-place
+            torch.mul(
+                torch.diagonal(self._motion_p_gains_task, dim1=-2, dim2=-1).sqrt(),
+                self._motion_d_gains_scale_task,
+                out=torch.diagonal(self._motion_d_gains_task, dim1=-2, dim2=-1),
             )
         elif self.cfg.impedance_mode == "variable":
             # split input command
             task_space_command, stiffness, damping_ratio = torch.split(command, [self.target_dim, 6, 6], dim=-1)
             # format command
             stiffness = stiffness.clip_(
-                min=self._motion_p_gains_limits[..., 0], max=self._motion_p_gains_limits[..., 1]
+                min=self._motion_p_gains_limits[0], max=self._motion_p_gains_limits[1]
             )
             damping_ratio = damping_ratio.clip_(
-                min=self._motion_damping_ratio_limits[..., 0], max=self._motion_damping_ratio_limits[..., 1]
+                min=self._motion_damping_ratio_limits[0], max=self._motion_damping_ratio_limits[1]
             )
             # task space targets + stiffness + damping
             self._task_space_target_task[:] = task_space_command
@@ -256,9 +269,7 @@ class OperationalSpaceController:
             raise ValueError(f"Invalid impedance mode: {self.cfg.impedance_mode}.")
 
         if current_task_frame_pose_b is None:
-            current_task_frame_pose_b = torch.tensor(
-                [[0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0]] * self.num_envs, device=self._device
-            )
+            current_task_frame_pose_b = self._default_task_frame_pose_b
 
         # Resolve the target commands
         target_groups = torch.split(self._task_space_target_task, self.target_list, dim=1)
@@ -11,7 +11,7 @@ from isaaclab.utils import configclass
 from .operational_space import OperationalSpaceController
 
 
-@configclass
+@configclass(slots=True)
 class OperationalSpaceControllerCfg:
     """Configuration for operational-space controller."""
 
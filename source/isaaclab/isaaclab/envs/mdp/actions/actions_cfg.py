@@ -221,7 +221,7 @@ class DifferentialInverseKinematicsActionCfg(ActionTermCfg):
     See :class:`DifferentialInverseKinematicsAction` for more details.
     """
 
-    @configclass
+    @configclass(slots=True)
     class OffsetCfg:
         """The offset pose from parent frame to child frame.
 
@@ -257,7 +257,7 @@ class OperationalSpaceControllerActionCfg(ActionTermCfg):
     See :class:`OperationalSpaceControllerAction` for more details.
     """
 
-    @configclass
+    @configclass(slots=True)
     class OffsetCfg:
         """The offset pose from parent frame to child frame.
 
@@ -131,12 +131,13 @@ class JointAction(ActionTerm):
         # store the raw actions
         self._raw_actions[:] = actions
         # apply the affine transformations
-        self._processed_actions = self._raw_actions * self._scale + self._offset
+        # note: the scale and offset are resolved into floats or tensors at construction. Thus, these can be
+        #   applied directly into the processed actions buffer without creating intermediate tensors.
+        torch.mul(self._raw_actions, self._scale, out=self._processed_actions)
+        self._processed_actions.add_(self._offset)
         # clip actions
         if self.cfg.clip is not None:
-            self._processed_actions = torch.clamp(
-                self._processed_actions, min=self._clip[:, :, 0], max=self._clip[:, :, 1]
-            )
+            self._processed_actions.clamp_(min=self._clip[:, :, 0], max=self._clip[:, :, 1])
 
     def reset(self, env_ids: Sequence[int] | None = None) -> None:
         self._raw_actions[env_ids] = 0.0
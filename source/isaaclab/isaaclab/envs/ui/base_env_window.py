@@ -254,18 +254,18 @@ class BaseEnvWindow:
             title: The title of the manager visualization frame.
             class_name: The name of the manager to visualize.
         """
-
-        if hasattr(self.env, class_name) and class_name in self.env.manager_visualizers:
-            manager = self.env.manager_visualizers[class_name]
-            if hasattr(manager, "has_debug_vis_implementation"):
-                self._create_debug_vis_ui_element(title, manager)
-            else:
-                print(
-                    f"ManagerLiveVisualizer cannot be created for manager: {class_name}, has_debug_vis_implementation"
-                    " does not exist"
-                )
-        else:
+        # note: the visualizers are created by the environment only for the managers it has. Thus, a single
+        #   lookup into the registry is sufficient to check for the existence of the manager.
+        manager = self.env.manager_visualizers.get(class_name)
+        if manager is None:
             print(f"ManagerLiveVisualizer cannot be created for manager: {class_name}, Manager does not exist")
+        elif hasattr(manager, "has_debug_vis_implementation"):
+            self._create_debug_vis_ui_element(title, manager)
+        else:
+            print(
+                f"ManagerLiveVisualizer cannot be created for manager: {class_name}, has_debug_vis_implementation"
+                " does not exist"
+            )
 
     """
     Custom callbacks for UI elements.
@@ -192,6 +192,10 @@ class ActionManager(ManagerBase):
 
         # call the base class constructor (this prepares the terms)
         super().__init__(cfg, env)
+        # store the dimensions of the action terms
+        # note: these do not change after the terms are created. Caching them avoids querying every
+        #   term for its dimension when splitting the actions at each environment step.
+        self._term_dims = [term.action_dim for term in self._terms.values()]
         # create buffers to store actions
         self._action = torch.zeros((self.num_envs, self.total_action_dim), device=self.device)
         self._prev_action = torch.zeros_like(self._action)
@@ -228,7 +232,7 @@ class ActionManager(ManagerBase):
     @property
     def total_action_dim(self) -> int:
         """Total dimension of actions."""
-        return sum(self.action_term_dim)
+        return sum(self._term_dims)
 
     @property
     def active_terms(self) -> list[str]:
@@ -238,7 +242,7 @@ class ActionManager(ManagerBase):
     @property
     def action_term_dim(self) -> list[int]:
         """Shape of each action term."""
-        return [term.action_dim for term in self._terms.values()]
+        return self._term_dims.copy()
 
     @property
     def action(self) -> torch.Tensor:
@@ -332,11 +336,8 @@ class ActionManager(ManagerBase):
         self._action[:] = action.to(self.device)
 
         # split the actions and apply to each tensor
-        idx = 0
-        for term in self._terms.values():
-            term_actions = action[:, idx : idx + term.action_dim]
+        for term, term_actions in zip(self._terms.values(), torch.split(action, self._term_dims, dim=1)):
             term.process_actions(term_actions)
-            idx += term.action_dim
 
     def apply_action(self) -> None:
         """Applies the actions to the environment/simulation.
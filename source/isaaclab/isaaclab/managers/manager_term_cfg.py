@@ -7,9 +7,8 @@
 
 from __future__ import annotations
 
-import torch
 from collections.abc import Callable
-from dataclasses import MISSING
+from dataclasses import MISSING, field
 from typing import TYPE_CHECKING, Any
 
 from isaaclab.utils import configclass
@@ -19,6 +18,8 @@ from isaaclab.utils.noise import NoiseCfg
 from .scene_entity_cfg import SceneEntityCfg
 
 if TYPE_CHECKING:
+    import torch
+
     from .action_manager import ActionTerm
     from .command_manager import CommandTerm
     from .manager_base import ManagerTermBase
@@ -42,7 +43,7 @@ class ManagerTermBaseCfg:
     .. _`callable classes`: https://docs.python.org/3/reference/datamodel.html#object.__call__
     """
 
-    params: dict[str, Any | SceneEntityCfg] = dict()
+    params: dict[str, Any | SceneEntityCfg] = field(default_factory=dict)
     """The parameters to be passed to the function as keyword arguments. Defaults to an empty dict.
 
     .. note::
@@ -305,7 +305,13 @@ class ObservationManager(ManagerBase):
         # evaluate terms: compute, add noise, clip, scale, custom modifiers
         for term_name, term_cfg in obs_terms:
             # compute term's value
-            obs: torch.Tensor = term_cfg.func(self._env, **term_cfg.params).clone()
+            # note: terms whose output is copied further down (concatenation or history) reuse a preallocated
+            #   buffer instead of cloning the term's output at every step.
+            term_buffer = self._group_obs_term_scratch_buffer[group_name].get(term_name)
+            if term_buffer is not None:
+                obs: torch.Tensor = term_buffer.copy_(term_cfg.func(self._env, **term_cfg.params))
+            else:
+                obs: torch.Tensor = term_cfg.func(self._env, **term_cfg.params).clone()
             # apply post-processing
             if term_cfg.modifiers is not None:
                 for modifier in term_cfg.modifiers:
@@ -348,6 +354,7 @@ class ObservationManager(ManagerBase):
         self._group_obs_class_term_cfgs: dict[str, list[ObservationTermCfg]] = dict()
         self._group_obs_concatenate: dict[str, bool] = dict()
         self._group_obs_term_history_buffer: dict[str, dict] = dict()
+        self._group_obs_term_scratch_buffer: dict[str, dict[str, torch.Tensor]] = dict()
         # create a list to store modifiers that are classes
         # we store it as a separate list to only call reset on them and prevent unnecessary calls
         self._group_obs_class_modifiers: list[modifiers.ModifierBase] = list()
@@ -374,6 +381,7 @@ class ObservationManager(ManagerBase):
             self._group_obs_term_cfgs[group_name] = list()
             self._group_obs_class_term_cfgs[group_name] = list()
             group_entry_history_buffer: dict[str, CircularBuffer] = dict()
+            group_entry_scratch_buffer: dict[str, torch.Tensor] = dict()
             # read common config for the group
             self._group_obs_concatenate[group_name] = group_cfg.concatenate_terms
             # check if config is dict already
@@ -408,7 +416,12 @@ class ObservationManager(ManagerBase):
                 self._group_obs_term_names[group_name].append(term_name)
                 self._group_obs_term_cfgs[group_name].append(term_cfg)
                 # call function the first time to fill up dimensions
-                obs_dims = tuple(term_cfg.func(self._env, **term_cfg.params).shape)
+                term_obs = term_cfg.func(self._env, **term_cfg.params)
+                obs_dims = tuple(term_obs.shape)
+                # create a reusable buffer for terms whose processed output is copied into the group output.
+                # otherwise, the returned tensor is handed out directly and needs to be a fresh copy every step.
+                if group_cfg.concatenate_terms or term_cfg.history_length > 0:
+                    group_entry_scratch_buffer[term_name] = torch.empty_like(term_obs)
                 # create history buffers and calculate history term dimensions
                 if term_cfg.history_length > 0:
                     group_entry_history_buffer[term_name] = CircularBuffer(
@@ -490,5 +503,6 @@ class ObservationManager(ManagerBase):
                     self._group_obs_class_term_cfgs[group_name].append(term_cfg)
                     # call reset (in-case above call to get obs dims changed the state)
                     term_cfg.func.reset()
-            # add history buffers for each group
+            # add history and scratch buffers for each group
             self._group_obs_term_history_buffer[group_name] = group_entry_history_buffer
+            self._group_obs_term_scratch_buffer[group_name] = group_entry_scratch_buffer
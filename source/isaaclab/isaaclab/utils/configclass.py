@@ -9,7 +9,7 @@ import inspect
 import types
 from collections.abc import Callable
 from copy import deepcopy
-from dataclasses import MISSING, Field, dataclass, field, replace
+from dataclasses import MISSING, Field, dataclass, field, fields, is_dataclass, replace
 from typing import Any, ClassVar
 
 from .dict import class_to_dict, update_class_from_dict
@@ -28,7 +28,7 @@ def __dataclass_transform__():
 
 
 @__dataclass_transform__()
-def configclass(cls, **kwargs):
+def configclass(cls=None, **kwargs):
     """Wrapper around `dataclass` functionality to add extra checks and utilities.
 
     As of Python 3.7, the standard dataclasses have two main issues which makes them non-generic for
@@ -74,8 +74,26 @@ def configclass(cls, **kwargs):
         # replace arbitrary fields using keyword arguments
         env_cfg_copy = env_cfg_copy.replace(num_envs=32)
 
+    The decorator can also be called with keyword arguments that are forwarded to :func:`dataclass`.
+    For instance, passing ``slots=True`` generates a class with ``__slots__`` for all the fields. Instances
+    of such classes do not carry a per-instance ``__dict__``, which reduces their memory footprint and
+    speeds up attribute access. This is useful for small leaf configurations that are instantiated often.
+
+    .. code-block:: python
+
+        @configclass(slots=True)
+        class GainsCfg:
+            stiffness: float = 100.0
+            damping: float = 10.0
+
+    .. note::
+        A slotted class only drops the instance ``__dict__`` if all its base classes are also slotted.
+        Additionally, since :func:`dataclass` re-creates the class when ``slots=True``, methods that rely on
+        the zero-argument form of :func:`super` are not supported in such classes.
+
     Args:
-        cls: The class to wrap around.
+        cls: The class to wrap around. Defaults to None, in which case a decorator is returned that
+            applies the keyword arguments.
         **kwargs: Additional arguments to pass to :func:`dataclass`.
 
     Returns:
@@ -83,6 +101,9 @@ def configclass(cls, **kwargs):
 
     .. _dataclass: https://docs.python.org/3/library/dataclasses.html
     """
+    # check if decorator is called with arguments
+    if cls is None:
+        return lambda cls: configclass(cls, **kwargs)
     # add type annotations
     _add_annotation_types(cls)
     # add field factory
@@ -262,6 +283,9 @@ def _validate(obj: object, prefix: str = "") -> list[str]:
     if type(obj) is type(MISSING):
         missing_fields.append(prefix)
         return missing_fields
+    elif obj is None or isinstance(obj, (bool, int, float, str)):
+        # skip leaf values early since they are the bulk of a configuration tree
+        return missing_fields
     elif isinstance(obj, (list, tuple)):
         for index, item in enumerate(obj):
             current_path = f"{prefix}[{index}]"
@@ -269,6 +293,12 @@ def _validate(obj: object, prefix: str = "") -> list[str]:
         return missing_fields
     elif isinstance(obj, dict):
         obj_dict = obj
+    elif hasattr(obj, "__dict__") and not hasattr(obj, "__slots__"):
+        obj_dict = obj.__dict__
+    elif is_dataclass(obj):
+        # note: fields of slotted classes are not stored in the instance `__dict__`
+        obj_dict = {f.name: getattr(obj, f.name) for f in fields(obj)}
+        obj_dict.update(getattr(obj, "__dict__", {}))
     elif hasattr(obj, "__dict__"):
         obj_dict = obj.__dict__
     else:
@@ -388,8 +418,9 @@ def _custom_post_init(obj):
         # check annotation
         ann = obj.__class__.__dict__.get(key)
         # duplicate data members that are mutable
+        # note: we bypass the class `__setattr__` so that this also works for frozen classes
         if not callable(value) and not isinstance(ann, property):
-            setattr(obj, key, deepcopy(value))
+            object.__setattr__(obj, key, deepcopy(value))
 
 
 def _combined_function(f1: Callable, f2: Callable) -> Callable:
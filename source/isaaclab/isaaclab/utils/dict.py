@@ -6,6 +6,7 @@
 """Sub-module for utilities for working with dictionaries."""
 
 import collections.abc
+import dataclasses
 import hashlib
 import json
 import torch
@@ -46,6 +47,12 @@ def class_to_dict(obj: object) -> dict[str, Any]:
         # dict, which would mean that a torch.tensor would be stored as an empty dict. Instead we
         # want to store it directly as the tensor.
         return obj
+    elif hasattr(obj, "__dict__") and not hasattr(obj, "__slots__"):
+        obj_dict = obj.__dict__
+    elif dataclasses.is_dataclass(obj):
+        # note: fields of slotted classes are not stored in the instance `__dict__`
+        obj_dict = {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+        obj_dict.update(getattr(obj, "__dict__", {}))
     elif hasattr(obj, "__dict__"):
         obj_dict = obj.__dict__
     else:
@@ -61,7 +68,7 @@ def class_to_dict(obj: object) -> dict[str, Any]:
         if callable(value):
             data[key] = callable_to_string(value)
         # check if attribute is a dictionary
-        elif hasattr(value, "__dict__") or isinstance(value, dict):
+        elif hasattr(value, "__dict__") or dataclasses.is_dataclass(value) or isinstance(value, dict):
             data[key] = class_to_dict(value)
         # check if attribute is a list or tuple
         elif isinstance(value, (list, tuple)):
@@ -10,6 +10,9 @@ import yaml
 
 from isaaclab.utils import class_to_dict
 
+# use the libyaml-backed dumper when available, since the pure-Python one is slow for large configurations
+_YAML_DUMPER = getattr(yaml, "CDumper", yaml.Dumper)
+
 
 def load_yaml(filename: str) -> dict:
     """Loads an input PKL file safely.
@@ -52,4 +55,4 @@ def dump_yaml(filename: str, data: dict | object, sort_keys: bool = False):
         data = class_to_dict(data)
     # save data
     with open(filename, "w") as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=sort_keys)
+        yaml.dump(data, f, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=sort_keys)
@@ -60,12 +60,14 @@ def uniform_noise(data: torch.Tensor, cfg: noise_cfg.UniformNoiseCfg) -> torch.T
     if isinstance(cfg.n_min, torch.Tensor):
         cfg.n_min = cfg.n_min.to(data.device)
 
+    # sample the noise and compose the operation in-place on its buffer to avoid intermediate tensors
+    noise = torch.rand_like(data).mul_(cfg.n_max - cfg.n_min).add_(cfg.n_min)
     if cfg.operation == "add":
-        return data + torch.rand_like(data) * (cfg.n_max - cfg.n_min) + cfg.n_min
+        return noise.add_(data)
     elif cfg.operation == "scale":
-        return data * (torch.rand_like(data) * (cfg.n_max - cfg.n_min) + cfg.n_min)
+        return noise.mul_(data)
     elif cfg.operation == "abs":
-        return torch.rand_like(data) * (cfg.n_max - cfg.n_min) + cfg.n_min
+        return noise
     else:
         raise ValueError(f"Unknown operation in noise: {cfg.operation}")
 
@@ -88,12 +90,14 @@ def gaussian_noise(data: torch.Tensor, cfg: noise_cfg.GaussianNoiseCfg) -> torch
     if isinstance(cfg.std, torch.Tensor):
         cfg.std = cfg.std.to(data.device)
 
+    # sample the noise and compose the operation in-place on its buffer to avoid intermediate tensors
+    noise = torch.randn_like(data).mul_(cfg.std).add_(cfg.mean)
     if cfg.operation == "add":
-        return data + cfg.mean + cfg.std * torch.randn_like(data)
+        return noise.add_(data)
     elif cfg.operation == "scale":
-        return data * (cfg.mean + cfg.std * torch.randn_like(data))
+        return noise.mul_(data)
     elif cfg.operation == "abs":
-        return cfg.mean + cfg.std * torch.randn_like(data)
+        return noise
     else:
         raise ValueError(f"Unknown operation in noise: {cfg.operation}")
 
@@ -31,7 +31,6 @@ from isaaclab.utils.math import (
     compute_pose_error,
     matrix_from_quat,
     quat_inv,
-    quat_rotate_inverse,
     subtract_frame_transforms,
 )
 
@@ -44,57 +43,14 @@ from isaaclab_assets import FRANKA_PANDA_CFG  # isort:skip
 class TestOperationalSpaceController(unittest.TestCase):
     """Test fixture for checking that Operational Space controller tracks commands properly."""
 
-    def setUp(self):
-        """Create a blank new stage for each test."""
-        # Wait for spawning
-        stage_utils.create_new_stage()
-        # Constants
-        self.num_envs = 16
-        # Load kit helper
-        sim_cfg = sim_utils.SimulationCfg(dt=0.01)
-        self.sim = sim_utils.SimulationContext(sim_cfg)
-        # TODO: Remove this once we have a better way to handle this.
-        self.sim._app_control_on_stop_handle = None
-
-        # Create a ground plane
-        cfg = sim_utils.GroundPlaneCfg()
-        cfg.func("/World/GroundPlane", cfg)
-
-        # Markers
-        frame_marker_cfg = FRAME_MARKER_CFG.copy()
-        frame_marker_cfg.markers["frame"].scale = (0.1, 0.1, 0.1)
-        self.ee_marker = VisualizationMarkers(frame_marker_cfg.replace(prim_path="/Visuals/ee_current"))
-        self.goal_marker = VisualizationMarkers(frame_marker_cfg.replace(prim_path="/Visuals/ee_goal"))
-
-        light_cfg = sim_utils.DistantLightCfg(intensity=5.0, exposure=10.0)
-        light_cfg.func(
-            "/Light",
-            light_cfg,
-            translation=[0, 0, 1],
-        )
-
-        # Create interface to clone the scene
-        cloner = GridCloner(spacing=2.0)
-        cloner.define_base_env("/World/envs")
-        self.env_prim_paths = cloner.generate_paths("/World/envs/env", self.num_envs)
-        # create source prim
-        prim_utils.define_prim(self.env_prim_paths[0], "Xform")
-        # clone the env xform
-        self.env_origins = cloner.clone(
-            source_prim_path=self.env_prim_paths[0],
-            prim_paths=self.env_prim_paths,
-            replicate_physics=True,
-        )
+    @classmethod
+    def setUpClass(cls):
+        """Create the target sets once for all tests.
 
-        self.robot_cfg = FRANKA_PANDA_CFG.replace(prim_path="/World/envs/env_.*/Robot")
-        self.robot_cfg.actuators["panda_shoulder"].stiffness = 0.0
-        self.robot_cfg.actuators["panda_shoulder"].damping = 0.0
-        self.robot_cfg.actuators["panda_forearm"].stiffness = 0.0
-        self.robot_cfg.actuators["panda_forearm"].damping = 0.0
-        self.robot_cfg.spawn.rigid_props.disable_gravity = True
-
-        # Define the ContactSensor
-        self.contact_forces = None
+        The targets are constant across tests. Thus, we create them only once instead of in every :meth:`setUp`.
+        """
+        # Device on which the simulation runs
+        device = sim_utils.SimulationCfg().device
 
         # Define the target sets
         ee_goal_abs_pos_set_b = torch.tensor(
@@ -103,7 +59,7 @@ class TestOperationalSpaceController(unittest.TestCase):
                 [0.5, -0.4, 0.6],
                 [0.5, 0, 0.5],
             ],
-            device=self.sim.device,
+            device=device,
         )
         ee_goal_abs_quad_set_b = torch.tensor(
             [
@@ -111,7 +67,7 @@ class TestOperationalSpaceController(unittest.TestCase):
                 [0.707, 0.707, 0.0, 0.0],
                 [0.0, 1.0, 0.0, 0.0],
             ],
-            device=self.sim.device,
+            device=device,
         )
         ee_goal_rel_pos_set = torch.tensor(
             [
@@ -119,7 +75,7 @@ class TestOperationalSpaceController(unittest.TestCase):
                 [0.2, 0.2, 0.0],
                 [0.2, 0.2, -0.2],
             ],
-            device=self.sim.device,
+            device=device,
         )
         ee_goal_rel_axisangle_set = torch.tensor(
             [
@@ -127,7 +83,7 @@ class TestOperationalSpaceController(unittest.TestCase):
                 [torch.pi / 2, 0.0, 0.0],  # for [0.707, 0.707, 0, 0]
                 [torch.pi, 0.0, 0.0],  # for [0.0, 1.0, 0, 0]
             ],
-            device=self.sim.device,
+            device=device,
         )
         ee_goal_abs_wrench_set_b = torch.tensor(
             [
@@ -135,7 +91,7 @@ class TestOperationalSpaceController(unittest.TestCase):
                 [0.0, 10.0, 0.0, 0.0, 0.0, 0.0],
                 [10.0, 0.0, 0.0, 0.0, 0.0, 0.0],
             ],
-            device=self.sim.device,
+            device=device,
         )
         kp_set = torch.tensor(
             [
@@ -143,7 +99,7 @@ class TestOperationalSpaceController(unittest.TestCase):
                 [240.0, 240.0, 240.0, 240.0, 240.0, 240.0],
                 [160.0, 160.0, 160.0, 160.0, 160.0, 160.0],
             ],
-            device=self.sim.device,
+            device=device,
         )
         d_ratio_set = torch.tensor(
             [
@@ -151,7 +107,7 @@ class TestOperationalSpaceController(unittest.TestCase):
                 [1.1, 1.1, 1.1, 1.1, 1.1, 1.1],
                 [0.9, 0.9, 0.9, 0.9, 0.9, 0.9],
             ],
-            device=self.sim.device,
+            device=device,
         )
         ee_goal_hybrid_set_b = torch.tensor(
             [
@@ -159,7 +115,7 @@ class TestOperationalSpaceController(unittest.TestCase):
                 [0.6, -0.29, 0.6, 0.0, 0.707, 0.0, 0.707, 10.0, 0.0, 0.0, 0.0, 0.0, 0.0],
                 [0.6, 0.1, 0.8, 0.0, 0.5774, 0.0, 0.8165, 4.0, 0.0, 0.0, 0.0, 0.0, 0.0],
             ],
-            device=self.sim.device,
+            device=device,
         )
         ee_goal_pose_set_tilted_b = torch.tensor(
             [
@@ -167,7 +123,7 @@ class TestOperationalSpaceController(unittest.TestCase):
                 [0.6, -0.3, 0.3, 0.0, 0.92387953, 0.0, 0.38268343],
                 [0.8, 0.0, 0.5, 0.0, 0.92387953, 0.0, 0.38268343],
             ],
-            device=self.sim.device,
+            device=device,
         )
         ee_goal_wrench_set_tilted_task = torch.tensor(
             [
@@ -175,29 +131,84 @@ class TestOperationalSpaceController(unittest.TestCase):
                 [0.0, 0.0, 10.0, 0.0, 0.0, 0.0],
                 [0.0, 0.0, 10.0, 0.0, 0.0, 0.0],
             ],
-            device=self.sim.device,
+            device=device,
         )
 
+        # Define goals for the arm [xyz + quat_wxyz] and the variable imp. [kp_xyz + kp_rot_xyz + d_xyz + d_rot_xyz]
+        # note: the targets with fewer entries are views into this tensor since they share the same leading columns
+        cls.target_abs_pose_variable_set = torch.cat(
+            [ee_goal_abs_pos_set_b, ee_goal_abs_quad_set_b, kp_set, d_ratio_set], dim=-1
+        )
         # Define goals for the arm [xyz]
-        self.target_abs_pos_set_b = ee_goal_abs_pos_set_b.clone()
+        cls.target_abs_pos_set_b = ee_goal_abs_pos_set_b
         # Define goals for the arm [xyz + quat_wxyz]
-        self.target_abs_pose_set_b = torch.cat([ee_goal_abs_pos_set_b, ee_goal_abs_quad_set_b], dim=-1)
+        cls.target_abs_pose_set_b = cls.target_abs_pose_variable_set[:, 0:7]
+        # Define goals for the arm [xyz + quat_wxyz] and variable kp [kp_xyz + kp_rot_xyz]
+        cls.target_abs_pose_variable_kp_set = cls.target_abs_pose_variable_set[:, 0:13]
         # Define goals for the arm [xyz]
-        self.target_rel_pos_set = ee_goal_rel_pos_set.clone()
+        cls.target_rel_pos_set = ee_goal_rel_pos_set
         # Define goals for the arm [xyz + axis-angle]
-        self.target_rel_pose_set_b = torch.cat([ee_goal_rel_pos_set, ee_goal_rel_axisangle_set], dim=-1)
+        cls.target_rel_pose_set_b = torch.cat([ee_goal_rel_pos_set, ee_goal_rel_axisangle_set], dim=-1)
         # Define goals for the arm [force_xyz + torque_xyz]
-        self.target_abs_wrench_set = ee_goal_abs_wrench_set_b.clone()
-        # Define goals for the arm [xyz + quat_wxyz] and variable kp [kp_xyz + kp_rot_xyz]
-        self.target_abs_pose_variable_kp_set = torch.cat([self.target_abs_pose_set_b, kp_set], dim=-1)
-        # Define goals for the arm [xyz + quat_wxyz] and the variable imp. [kp_xyz + kp_rot_xyz + d_xyz + d_rot_xyz]
-        self.target_abs_pose_variable_set = torch.cat([self.target_abs_pose_set_b, kp_set, d_ratio_set], dim=-1)
-        # Define goals for the arm pose [xyz + quat_wxyz] and wrench [force_xyz + torque_xyz]
-        self.target_hybrid_set_b = ee_goal_hybrid_set_b.clone()
+        cls.target_abs_wrench_set = ee_goal_abs_wrench_set_b
         # Define goals for the arm pose, and wrench, and kp
-        self.target_hybrid_variable_kp_set = torch.cat([self.target_hybrid_set_b, kp_set], dim=-1)
+        cls.target_hybrid_variable_kp_set = torch.cat([ee_goal_hybrid_set_b, kp_set], dim=-1)
+        # Define goals for the arm pose [xyz + quat_wxyz] and wrench [force_xyz + torque_xyz]
+        cls.target_hybrid_set_b = cls.target_hybrid_variable_kp_set[:, 0:13]
         # Define goals for the arm pose [xyz + quat_wxyz] in root and and wrench [force_xyz + torque_xyz] in task frame
-        self.target_hybrid_set_tilted = torch.cat([ee_goal_pose_set_tilted_b, ee_goal_wrench_set_tilted_task], dim=-1)
+        cls.target_hybrid_set_tilted = torch.cat([ee_goal_pose_set_tilted_b, ee_goal_wrench_set_tilted_task], dim=-1)
+
+    def setUp(self):
+        """Create a blank new stage for each test."""
+        # Wait for spawning
+        stage_utils.create_new_stage()
+        # Constants
+        self.num_envs = 16
+        # Load kit helper
+        sim_cfg = sim_utils.SimulationCfg(dt=0.01)
+        self.sim = sim_utils.SimulationContext(sim_cfg)
+        # TODO: Remove this once we have a better way to handle this.
+        self.sim._app_control_on_stop_handle = None
+
+        # Create a ground plane
+        cfg = sim_utils.GroundPlaneCfg()
+        cfg.func("/World/GroundPlane", cfg)
+
+        # Markers
+        frame_marker_cfg = FRAME_MARKER_CFG.copy()
+        frame_marker_cfg.markers["frame"].scale = (0.1, 0.1, 0.1)
+        self.ee_marker = VisualizationMarkers(frame_marker_cfg.replace(prim_path="/Visuals/ee_current"))
+        self.goal_marker = VisualizationMarkers(frame_marker_cfg.replace(prim_path="/Visuals/ee_goal"))
+
+        light_cfg = sim_utils.DistantLightCfg(intensity=5.0, exposure=10.0)
+        light_cfg.func(
+            "/Light",
+            light_cfg,
+            translation=[0, 0, 1],
+        )
+
+        # Create interface to clone the scene
+        cloner = GridCloner(spacing=2.0)
+        cloner.define_base_env("/World/envs")
+        self.env_prim_paths = cloner.generate_paths("/World/envs/env", self.num_envs)
+        # create source prim
+        prim_utils.define_prim(self.env_prim_paths[0], "Xform")
+        # clone the env xform
+        self.env_origins = cloner.clone(
+            source_prim_path=self.env_prim_paths[0],
+            prim_paths=self.env_prim_paths,
+            replicate_physics=True,
+        )
+
+        self.robot_cfg = FRANKA_PANDA_CFG.replace(prim_path="/World/envs/env_.*/Robot")
+        self.robot_cfg.actuators["panda_shoulder"].stiffness = 0.0
+        self.robot_cfg.actuators["panda_shoulder"].damping = 0.0
+        self.robot_cfg.actuators["panda_forearm"].stiffness = 0.0
+        self.robot_cfg.actuators["panda_forearm"].damping = 0.0
+        self.robot_cfg.spawn.rigid_props.disable_gravity = True
+
+        # Define the ContactSensor
+        self.contact_forces = None
 
         # Reference frame for targets
         self.frame = "root"
@@ -342,7 +353,7 @@ class TestOperationalSpaceController(unittest.TestCase):
         contact_forces_cfg = ContactSensorCfg(
             prim_path="/World/envs/env_.*/obstacle.*",
             update_period=0.0,
-            history_length=50,
+            history_length=4,
             debug_vis=False,
             force_threshold=0.1,
         )
@@ -689,11 +700,19 @@ class TestOperationalSpaceController(unittest.TestCase):
             arm_joint_names (list[str]): The names of the arm joints.
             target_set (torch.tensor): The target set to track.
         """
-        # Initialize the masks for evaluating target convergence according to selection matrices
-        self.pos_mask = torch.tensor(osc.cfg.motion_control_axes_task[:3], device=self.sim.device).view(1, 3)
-        self.rot_mask = torch.tensor(osc.cfg.motion_control_axes_task[3:], device=self.sim.device).view(1, 3)
-        self.wrench_mask = torch.tensor(osc.cfg.contact_wrench_control_axes_task, device=self.sim.device).view(1, 6)
-        self.force_mask = self.wrench_mask[:, 0:3]  # Take only the force components as we can measure only these
+        # Initialize the axes for evaluating target convergence according to selection matrices
+        # note: for the wrench, take only the force components as we can measure only these
+        motion_axes = osc.cfg.motion_control_axes_task
+        wrench_axes = osc.cfg.contact_wrench_control_axes_task
+        axes = (
+            [i for i in range(3) if motion_axes[i]],
+            [i for i in range(3) if motion_axes[3 + i]],
+            [i for i in range(3) if wrench_axes[i]],
+        )
+        # move all the indices to the device at once and split them into the position, rotation and force axes
+        self.pos_axes, self.rot_axes, self.force_axes = torch.tensor(
+            axes[0] + axes[1] + axes[2], dtype=torch.long, device=self.sim.device
+        ).split([len(axis_ids) for axis_ids in axes])
 
         # Define simulation stepping
         sim_dt = self.sim.get_physics_dt()
@@ -703,7 +722,10 @@ class TestOperationalSpaceController(unittest.TestCase):
         # Obtain the frame index of the end-effector
         ee_frame_idx = robot.find_bodies(ee_frame_name)[0][0]
         # Obtain joint indices
-        arm_joint_ids = robot.find_joints(arm_joint_names)[0]
+        # note: these are kept as a tensor to avoid converting them for indexing the buffers at every step
+        arm_joint_ids = torch.tensor(robot.find_joints(arm_joint_names)[0], device=self.sim.device)
+        # Create the end-effector force used when there is no contact sensor (it is never modified)
+        self._zero_ee_force_w = torch.zeros(self.num_envs, 3, device=self.sim.device)
 
         # Update existing buffers
         # Note: We need to update buffers before the first step for the controller.
@@ -759,9 +781,9 @@ class TestOperationalSpaceController(unittest.TestCase):
                     self.contact_forces.reset()
                 # reset target pose
                 robot.update(sim_dt)
-                _, _, _, ee_pose_b, _, _, _, _, _, _ = self._update_states(
-                    robot, ee_frame_idx, arm_joint_ids
-                )  # at reset, the jacobians are not updated to the latest state
+                # note: only the end-effector pose is needed here. The jacobians are not updated to the latest
+                #   state at reset, so there is no point in reading the remaining quantities.
+                ee_pose_b, _, _ = self._compute_ee_pose(robot, ee_frame_idx)
                 command, ee_target_pose_b, ee_target_pose_w, current_goal_idx = self._update_target(
                     osc, root_pose_w, ee_pose_b, target_set, current_goal_idx
                 )
@@ -802,9 +824,10 @@ class TestOperationalSpaceController(unittest.TestCase):
                 robot.set_joint_effort_target(joint_efforts, joint_ids=arm_joint_ids)
                 robot.write_data_to_sim()
 
-            # update marker positions
-            self.ee_marker.visualize(ee_pose_w[:, 0:3], ee_pose_w[:, 3:7])
-            self.goal_marker.visualize(ee_target_pose_w[:, 0:3], ee_target_pose_w[:, 3:7])
+            # update marker positions (only when they can be seen)
+            if self.sim.has_gui():
+                self.ee_marker.visualize(ee_pose_w[:, 0:3], ee_pose_w[:, 3:7])
+                self.goal_marker.visualize(ee_target_pose_w[:, 0:3], ee_target_pose_w[:, 3:7])
 
             # perform step
             self.sim.step(render=False)
@@ -815,14 +838,14 @@ class TestOperationalSpaceController(unittest.TestCase):
         self,
         robot: Articulation,
         ee_frame_idx: int,
-        arm_joint_ids: list[int],
+        arm_joint_ids: torch.Tensor,
     ):
         """Update the states of the robot and obtain the relevant quantities for the operational space controller.
 
         Args:
             robot (Articulation): The robot to control.
             ee_frame_idx (int): The index of the end-effector frame.
-            arm_joint_ids (list[int]): The indices of the arm joints.
+            arm_joint_ids (torch.Tensor): The indices of the arm joints.
 
         Returns:
             jacobian_b (torch.tensor): The Jacobian in the root frame.
@@ -838,39 +861,36 @@ class TestOperationalSpaceController(unittest.TestCase):
         """
         # obtain dynamics related quantities from simulation
         ee_jacobi_idx = ee_frame_idx - 1
-        jacobian_w = robot.root_physx_view.get_jacobians()[:, ee_jacobi_idx, :, arm_joint_ids]
-        mass_matrix = robot.root_physx_view.get_generalized_mass_matrices()[:, arm_joint_ids, :][:, :, arm_joint_ids]
+        # note: the indexing below already returns copies, so the quantities can be modified in-place
+        jacobian_w = robot.root_physx_view.get_jacobians()[:, ee_jacobi_idx].index_select(-1, arm_joint_ids)
+        mass_matrix = robot.root_physx_view.get_generalized_mass_matrices()[
+            :, arm_joint_ids.unsqueeze(-1), arm_joint_ids
+        ]
         gravity = robot.root_physx_view.get_gravity_compensation_forces()[:, arm_joint_ids]
         # Convert the Jacobian from world to root frame
-        jacobian_b = jacobian_w.clone()
+        jacobian_b = jacobian_w
         root_rot_matrix = matrix_from_quat(quat_inv(robot.data.root_quat_w))
         jacobian_b[:, :3, :] = torch.bmm(root_rot_matrix, jacobian_b[:, :3, :])
         jacobian_b[:, 3:, :] = torch.bmm(root_rot_matrix, jacobian_b[:, 3:, :])
 
         # Compute current pose of the end-effector
-        root_pose_w = robot.data.root_state_w[:, 0:7]
-        ee_pose_w = robot.data.body_state_w[:, ee_frame_idx, 0:7]
-        ee_pos_b, ee_quat_b = subtract_frame_transforms(
-            root_pose_w[:, 0:3], root_pose_w[:, 3:7], ee_pose_w[:, 0:3], ee_pose_w[:, 3:7]
-        )
-        ee_pose_b = torch.cat([ee_pos_b, ee_quat_b], dim=-1)
+        ee_pose_b, root_pose_w, ee_pose_w = self._compute_ee_pose(robot, ee_frame_idx)
 
         # Compute the current velocity of the end-effector
         ee_vel_w = robot.data.body_vel_w[:, ee_frame_idx, :]  # Extract end-effector velocity in the world frame
         root_vel_w = robot.data.root_vel_w  # Extract root velocity in the world frame
         relative_vel_w = ee_vel_w - root_vel_w  # Compute the relative velocity in the world frame
-        ee_lin_vel_b = quat_rotate_inverse(robot.data.root_quat_w, relative_vel_w[:, 0:3])  # From world to root frame
-        ee_ang_vel_b = quat_rotate_inverse(robot.data.root_quat_w, relative_vel_w[:, 3:6])
-        ee_vel_b = torch.cat([ee_lin_vel_b, ee_ang_vel_b], dim=-1)
+        # From world to root frame: rotate the linear and angular parts together using the root rotation from above
+        ee_vel_b = torch.bmm(root_rot_matrix, relative_vel_w.view(-1, 2, 3).mT).mT.reshape(-1, 6)
 
         # Calculate the contact force
-        ee_force_w = torch.zeros(self.num_envs, 3, device=self.sim.device)
+        ee_force_w = self._zero_ee_force_w
         if self.contact_forces is not None:  # Only modify if it exist
             sim_dt = self.sim.get_physics_dt()
             self.contact_forces.update(sim_dt)  # update contact sensor
-            # Calculate the contact force by averaging over last four time steps (i.e., to smoothen) and
+            # Calculate the contact force by averaging over the sensor history (i.e., to smoothen) and
             # taking the max of three surfaces as only one should be the contact of interest
-            ee_force_w, _ = torch.max(torch.mean(self.contact_forces.data.net_forces_w_history, dim=1), dim=1)
+            ee_force_w = torch.mean(self.contact_forces.data.net_forces_w_history, dim=1).amax(dim=1)
 
         # This is a simplification, only for the sake of testing.
         ee_force_b = ee_force_w
@@ -892,6 +912,27 @@ class TestOperationalSpaceController(unittest.TestCase):
             joint_vel,
         )
 
+    def _compute_ee_pose(self, robot: Articulation, ee_frame_idx: int):
+        """Compute the current pose of the end-effector.
+
+        Args:
+            robot (Articulation): The robot to control.
+            ee_frame_idx (int): The index of the end-effector frame.
+
+        Returns:
+            ee_pose_b (torch.tensor): The end-effector pose in the root frame.
+            root_pose_w (torch.tensor): The root pose in the world frame.
+            ee_pose_w (torch.tensor): The end-effector pose in the world frame.
+        """
+        root_pose_w = robot.data.root_state_w[:, 0:7]
+        ee_pose_w = robot.data.body_state_w[:, ee_frame_idx, 0:7]
+        ee_pos_b, ee_quat_b = subtract_frame_transforms(
+            root_pose_w[:, 0:3], root_pose_w[:, 3:7], ee_pose_w[:, 0:3], ee_pose_w[:, 3:7]
+        )
+        ee_pose_b = torch.cat([ee_pos_b, ee_quat_b], dim=-1)
+
+        return ee_pose_b, root_pose_w, ee_pose_w
+
     def _update_target(
         self,
         osc: OperationalSpaceController,
@@ -912,15 +953,15 @@ class TestOperationalSpaceController(unittest.TestCase):
         Returns:
             command (torch.tensor): The target command.
             ee_target_pose_b (torch.tensor): The end-effector target pose in the body frame.
-            ee_target_pose_w (torch.tensor): The end-effector target pose in the world frame.
+            ee_target_pose_w (torch.tensor | None): The end-effector target pose in the world frame. None if the
+                simulation has no GUI, since it is only used for visualization.
             next_goal_idx (int): The next goal index.
 
         Raises:
             ValueError: If the target type is undefined.
         """
         # update the ee desired command
-        command = torch.zeros(self.num_envs, osc.action_dim, device=self.sim.device)
-        command[:] = target_set[current_goal_idx]
+        command = target_set[current_goal_idx].repeat(self.num_envs, 1)
 
         # update the ee desired pose
         ee_target_pose_b = torch.zeros(self.num_envs, 7, device=self.sim.device)
@@ -936,11 +977,13 @@ class TestOperationalSpaceController(unittest.TestCase):
             else:
                 raise ValueError("Undefined target_type within _update_target().")
 
-        # update the target desired pose in world frame (for marker)
-        ee_target_pos_w, ee_target_quat_w = combine_frame_transforms(
-            root_pose_w[:, 0:3], root_pose_w[:, 3:7], ee_target_pose_b[:, 0:3], ee_target_pose_b[:, 3:7]
-        )
-        ee_target_pose_w = torch.cat([ee_target_pos_w, ee_target_quat_w], dim=-1)
+        # update the target desired pose in world frame (only needed for the marker)
+        ee_target_pose_w = None
+        if self.sim.has_gui():
+            ee_target_pos_w, ee_target_quat_w = combine_frame_transforms(
+                root_pose_w[:, 0:3], root_pose_w[:, 3:7], ee_target_pose_b[:, 0:3], ee_target_pose_b[:, 3:7]
+            )
+            ee_target_pose_w = torch.cat([ee_target_pos_w, ee_target_quat_w], dim=-1)
 
         next_goal_idx = (current_goal_idx + 1) % len(target_set)
 
@@ -1023,30 +1066,19 @@ class TestOperationalSpaceController(unittest.TestCase):
         """
         cmd_idx = 0
         for target_type in osc.cfg.target_types:
-            if target_type == "pose_abs":
-                pos_error, rot_error = compute_pose_error(
-                    ee_pose_b[:, 0:3], ee_pose_b[:, 3:7], ee_target_pose_b[:, 0:3], ee_target_pose_b[:, 3:7]
-                )
-                pos_error_norm = torch.norm(pos_error * self.pos_mask, dim=-1)
-                rot_error_norm = torch.norm(rot_error * self.rot_mask, dim=-1)
-                # desired error (zer)
-                des_error = torch.zeros_like(pos_error_norm)
-                # check convergence
-                torch.testing.assert_close(pos_error_norm, des_error, rtol=0.0, atol=0.1)
-                torch.testing.assert_close(rot_error_norm, des_error, rtol=0.0, atol=0.1)
-                cmd_idx += 7
-            elif target_type == "pose_rel":
+            if target_type in ("pose_abs", "pose_rel"):
+                # note: the target pose is already resolved to an absolute pose for both target types
                 pos_error, rot_error = compute_pose_error(
                     ee_pose_b[:, 0:3], ee_pose_b[:, 3:7], ee_target_pose_b[:, 0:3], ee_target_pose_b[:, 3:7]
                 )
-                pos_error_norm = torch.norm(pos_error * self.pos_mask, dim=-1)
-                rot_error_norm = torch.norm(rot_error * self.rot_mask, dim=-1)
+                pos_error_norm = torch.linalg.vector_norm(pos_error.index_select(-1, self.pos_axes), dim=-1)
+                rot_error_norm = torch.linalg.vector_norm(rot_error.index_select(-1, self.rot_axes), dim=-1)
                 # desired error (zer)
                 des_error = torch.zeros_like(pos_error_norm)
                 # check convergence
                 torch.testing.assert_close(pos_error_norm, des_error, rtol=0.0, atol=0.1)
                 torch.testing.assert_close(rot_error_norm, des_error, rtol=0.0, atol=0.1)
-                cmd_idx += 6
+                cmd_idx += 7 if target_type == "pose_abs" else 6
             elif target_type == "wrench_abs":
                 force_target_b = ee_target_b[:, cmd_idx : cmd_idx + 3].clone()
                 # Convert to base frame if the target was defined in task frame
@@ -1055,8 +1087,8 @@ class TestOperationalSpaceController(unittest.TestCase):
                     R_task_b = matrix_from_quat(task_frame_pose_b[:, 3:])
                     force_target_b[:] = (R_task_b @ force_target_b[:].unsqueeze(-1)).squeeze(-1)
                 force_error = ee_force_b - force_target_b
-                force_error_norm = torch.norm(
-                    force_error * self.force_mask, dim=-1
+                force_error_norm = torch.linalg.vector_norm(
+                    force_error.index_select(-1, self.force_axes), dim=-1
                 )  # ignore torque part as we cannot measure it
                 des_error = torch.zeros_like(force_error_norm)
                 # check convergence: big threshold here as the force control is not precise when the robot moves
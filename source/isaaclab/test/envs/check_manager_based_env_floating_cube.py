@@ -96,8 +96,8 @@ class CubeActionTerm(ActionTerm):
         self._processed_actions = torch.zeros(env.num_envs, 3, device=self.device)
         self._vel_command = torch.zeros(self.num_envs, 6, device=self.device)
         # gains of controller
-        self.p_gain = 5.0
-        self.d_gain = 0.5
+        self.p_gain = cfg.p_gain
+        self.d_gain = cfg.d_gain
 
     """
     Properties.
@@ -128,10 +128,15 @@ class CubeActionTerm(ActionTerm):
 
     def apply_actions(self):
         # implement a PD controller to track the target position
-        pos_error = self._processed_actions - (self._asset.data.root_pos_w - self._env.scene.env_origins)
-        vel_error = -self._asset.data.root_lin_vel_w
+        # note: the control law is evaluated in-place on the velocity command buffer to avoid
+        #   allocating intermediate tensors for the position and velocity errors at every step.
+        lin_vel_command = self._vel_command[:, :3]
+        # -- position error: target - (root_pos_w - env_origins)
+        torch.sub(self._processed_actions, self._asset.data.root_pos_w, out=lin_vel_command)
+        lin_vel_command.add_(self._env.scene.env_origins)
+        # -- velocity targets: p_gain * pos_error + d_gain * (0 - root_lin_vel_w)
+        lin_vel_command.mul_(self.p_gain).sub_(self._asset.data.root_lin_vel_w, alpha=self.d_gain)
         # set velocity targets
-        self._vel_command[:, :3] = self.p_gain * pos_error + self.d_gain * vel_error
         self._asset.write_root_velocity_to_sim(self._vel_command)
 
 
@@ -141,6 +146,12 @@ class CubeActionTermCfg(ActionTermCfg):
 
     class_type: type = CubeActionTerm
 
+    p_gain: float = 5.0
+    """Proportional gain of the PD controller."""
+
+    d_gain: float = 0.5
+    """Derivative gain of the PD controller."""
+
 
 ##
 # Observation Term
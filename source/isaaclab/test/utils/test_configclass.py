@@ -393,6 +393,36 @@ class MissingChildDemoCfg(MissingParentDemoCfg):
     e: dict = {}
 
 
+"""
+Dummy configuration: Slots and frozen
+"""
+
+
+@configclass(slots=True)
+class SlotsDemoCfg:
+    """Dummy configuration with slots."""
+
+    a: int = 1
+    b: list = [1, 2]
+    c: ViewerCfg = ViewerCfg()
+    d: str = MISSING
+
+
+@configclass
+class SlotsChildDemoCfg(SlotsDemoCfg):
+    """Dummy child configuration of a class with slots."""
+
+    e: float = 2.0
+
+
+@configclass(frozen=True)
+class FrozenDemoCfg:
+    """Dummy frozen configuration."""
+
+    a: int = 1
+    b: tuple = (1, 2)
+
+
 """
 Test solutions: Basic
 """
@@ -1008,6 +1038,52 @@ class TestConfigClass(unittest.TestCase):
 
         self.assertEqual(md5_hash_1, md5_hash_2)
 
+    def test_slots_config(self):
+        """Test configuration classes with slots."""
+        cfg_1 = SlotsDemoCfg(d="hello")
+        cfg_2 = SlotsDemoCfg(d="world")
+        # check that the instance does not have a dictionary
+        self.assertFalse(hasattr(cfg_1, "__dict__"))
+        with self.assertRaises(AttributeError):
+            cfg_1.f = 2
+        # check that mutable members are not shared
+        cfg_1.b.append(3)
+        self.assertEqual(cfg_2.b, [1, 2])
+        self.assertIsNot(cfg_1.c, cfg_2.c)
+        # check dictionary conversion
+        self.assertDictEqual(
+            cfg_1.to_dict(),
+            {"a": 1, "b": [1, 2, 3], "c": {"eye": [7.5, 7.5, 7.5], "lookat": [0.0, 0.0, 0.0]}, "d": "hello"},
+        )
+        # check update from dictionary
+        cfg_1.from_dict({"a": 4, "c": {"eye": [1.0, 2.0, 3.0]}})
+        self.assertEqual(cfg_1.a, 4)
+        self.assertEqual(cfg_1.c.eye, [1.0, 2.0, 3.0])
+        # check copying
+        cfg_copy = copy.deepcopy(cfg_1)
+        self.assertEqual(cfg_copy, cfg_1)
+        self.assertEqual(cfg_1.replace(a=5).a, 5)
+        # check inheritance from a class with slots
+        cfg_child = SlotsChildDemoCfg(d="child")
+        self.assertDictEqual(
+            cfg_child.to_dict(),
+            {"a": 1, "b": [1, 2], "c": {"eye": [7.5, 7.5, 7.5], "lookat": [0.0, 0.0, 0.0]}, "d": "child", "e": 2.0},
+        )
+        # check validation of missing fields
+        with self.assertRaises(TypeError) as context:
+            SlotsChildDemoCfg().validate()
+        self.assertIn("  - d", str(context.exception))
+
+    def test_frozen_config(self):
+        """Test frozen configuration classes."""
+        cfg = FrozenDemoCfg()
+        with self.assertRaises(AttributeError):
+            cfg.a = 2
+        # check that replacing fields creates a new object
+        cfg_new = cfg.replace(a=2)
+        self.assertEqual(cfg.a, 1)
+        self.assertEqual(cfg_new.a, 2)
+
     def test_validity(self):
         """Check that invalid configurations raise errors."""
 